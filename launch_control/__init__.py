@@ -3,6 +3,15 @@ Launch Control package exports.
 """
 
 from .cli import main
-from .houston import MissionControl
 
 __all__ = ["main", "MissionControl"]
+
+
+def __getattr__(name):
+    # MissionControl pulls in the whole launch pipeline; load it on first use
+    # so `devin-launch-control` stays quick when it only talks to the daemon.
+    if name == "MissionControl":
+        from .houston import MissionControl
+
+        return MissionControl
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,16 @@
 API implementation for the devin launch control.
 """
 
-import json
 import os
+import threading
+import time
 import urllib.error
 import urllib.request
 import uuid
-from typing import Mapping, Optional
+from typing import List, Mapping, Optional, Tuple
+
+from .key_pool import KeyPool, load_keys
+from .serialization import dumps_bytes, loads
 
 try:
     import requests  # type: ignore
@@ -23,86 +27,263 @@ class DevinAPI:
     # Devin AI API details
     API_URL = "https://api.devin.ai/v1/sessions"
     API_KEY_ENV_VAR = "DEVIN_API_KEY"
+    API_KEYS_ENV_VAR = "DEVIN_API_KEYS"
+    API_KEY_FILE_ENV_VAR = "DEVIN_API_KEY_FILE"
+
+    # Seconds to wait for a connection and then for the response.
+    CONNECT_TIMEOUT = 10.0
+    READ_TIMEOUT = 60.0
 
     def __init__(
         self,
         api_url: Optional[str] = None,
         api_key: Optional[str] = None,
         session=None,
+        key_policy: str = "round-robin",
+        key_rate: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
     ):
         self.api_url = api_url or self.API_URL
+        self.connect_timeout = connect_timeout or self.CONNECT_TIMEOUT
+        self.read_timeout = read_timeout or self.READ_TIMEOUT
         if api_key is not None:
-            self.api_key = api_key
+            keys = [api_key] if api_key else []
         else:
-            self.api_key = os.getenv(self.API_KEY_ENV_VAR)
-        if not self.api_key:
+            keys = self.configured_keys()
+        if not keys:
             raise RuntimeError(
                 f"{self.API_KEY_ENV_VAR} environment variable is required."
             )
 
-        if session is not None:
-            self._session = session
-        elif requests is not None:
-            self._session = requests
-        else:
-            self._session = None
+        self.api_key = keys[0]
+        self.key_pool = KeyPool(keys, policy=key_policy, rate=key_rate)
+
+        self._session = session if session is not None else self.default_session()
+
+    @classmethod
+    def configured_keys(cls) -> List[str]:
+        """
+        API keys from the environment: the key list or key file if set,
+        otherwise the single key.
+        """
+
+        keys = load_keys(cls.API_KEYS_ENV_VAR, cls.API_KEY_FILE_ENV_VAR)
+        if not keys and os.getenv(cls.API_KEY_ENV_VAR):
+            keys = [os.getenv(cls.API_KEY_ENV_VAR)]
+        return keys
+
+    @staticmethod
+    def default_session():
+        """
+        The transport used when no session is injected: a `requests.Session`,
+        which keeps connections alive across posts, or a urllib adapter.
+        """
+
+        if requests is not None:
+            return requests.Session()
+        return _UrllibSession()
+
+    def warm_up(self) -> Optional[threading.Thread]:
+        """
+        Open a pooled connection to the API host in the background, so the
+        first post skips the TCP and TLS handshakes. Best effort: failures
+        are ignored, and sessions without connection pooling are left alone.
+        """
 
-    def _post_json(self, data: Mapping) -> "_HttpResponse":
+        head = getattr(self._session, "head", None)
+        if head is None:
+            return None
+
+        def connect():
+            try:
+                # No credentials: only the connection matters, not the answer.
+                head(self.api_url, timeout=(self.connect_timeout, self.connect_timeout))
+            except Exception:  # pragma: no cover - depends on the network
+                pass
+
+        thread = threading.Thread(target=connect, name="devin-api-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def _timeouts(
+        self,
+        deadline: Optional[float],
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+    ) -> Optional[Tuple[float, float]]:
         """
-        Post JSON to the API.
+        Connect and read timeouts (the client's unless overridden for this
+        request), shortened to fit before `deadline` (a `time.monotonic()`
+        value). None if the deadline has passed.
+        """
+
+        connect_timeout = connect_timeout or self.connect_timeout
+        read_timeout = read_timeout or self.read_timeout
+        if deadline is None:
+            return connect_timeout, read_timeout
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return min(connect_timeout, remaining), min(read_timeout, remaining)
+
+    def _post_json(
+        self,
+        data: Mapping,
+        deadline: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+    ) -> "_HttpResponse":
+        """
+        Post JSON to the API using the next key from the pool.
+        """
+
+        if self._timeouts(deadline) is None:
+            return _HttpResponse.skipped_at_deadline(data)
+
+        key = self.key_pool.acquire(deadline)
+        if key is None:
+            # Every key was benched past the end of the run.
+            return _HttpResponse.skipped_at_deadline(data)
+
+        timeouts = self._timeouts(deadline, connect_timeout, read_timeout)
+        if timeouts is None:
+            # Waiting out a benched key used up the rest of the run.
+            self.key_pool.cancel(key)
+            return _HttpResponse.skipped_at_deadline(data)
+
+        response = self._send(data, key.key, timeouts)
+        self.key_pool.release(key, response)
+        return response
+
+    def _send(
+        self, data: Mapping, api_key: str, timeouts: Tuple[float, float]
+    ) -> "_HttpResponse":
+        """
+        Post JSON to the API with a specific key.
         """
 
         headers = {
-            "Authorization": f"Bearer {self.api_key}",
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
 
-        if self._session is not None:
-            try:
-                response = self._session.post(self.api_url, headers=headers, json=data)
-                return _HttpResponse(response.status_code, response.text)
-            except Exception as exc:  # pragma: no cover - depends on session impl
-                return _HttpResponse(0, str(exc))
-
-        payload = json.dumps(data).encode("utf-8")
-        request = urllib.request.Request(
-            self.api_url,
-            data=payload,
-            headers=headers,
-            method="POST",
-        )
+        # Encode once, straight to bytes, for either transport.
+        payload = dumps_bytes(data)
 
         try:
-            with urllib.request.urlopen(request) as resp:
-                body = resp.read().decode("utf-8")
-                status_code = resp.getcode()
-        except urllib.error.HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            status_code = exc.code
-        except urllib.error.URLError as exc:
-            return _HttpResponse(0, str(exc.reason))
+            response = self._session.post(
+                self.api_url, headers=headers, data=payload, timeout=timeouts
+            )
+        except Exception as exc:  # pragma: no cover - depends on session impl
+            return _HttpResponse(0, str(exc) or type(exc).__name__, data)
 
-        return _HttpResponse(status_code, body)
+        return _HttpResponse(
+            response.status_code,
+            response.text,
+            data,
+            getattr(response, "headers", None),
+        )
 
-    def post_prompt(self, prompt: str):
+    @staticmethod
+    def prompt_payload(prompt: str) -> dict:
         """
-        Post a session to the API.
+        Build the session payload for a prompt.
         """
 
         # add a UUID to the end of the prompt to make it unique
         prompt = f"{prompt}\n\n{uuid.uuid4()}"
 
-        data = {"prompt": f"{prompt}", "idempotent": True}
+        return {"prompt": f"{prompt}", "idempotent": True}
+
+    def post_payload(
+        self,
+        data: Mapping,
+        deadline: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+    ):
+        """
+        Post a prebuilt session payload, e.g. one replayed from the dead-letter spool.
+        """
+
+        return self._post_json(data, deadline, connect_timeout, read_timeout)
+
+    def post_prompt(
+        self,
+        prompt: str,
+        deadline: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+    ):
+        """
+        Post a session to the API. The timeouts override the client's for
+        this request only, e.g. for one job run by a shared daemon client.
+        """
 
-        return self._post_json(data)
+        return self._post_json(
+            self.prompt_payload(prompt), deadline, connect_timeout, read_timeout
+        )
 
 
 class _HttpResponse:
     """Minimal response object to mimic requests.Response."""
 
-    def __init__(self, status_code, text):
+    def __init__(
+        self, status_code, text, request_payload=None, headers=None, skipped=False
+    ):
         self.status_code = status_code
         self.text = text
+        # The payload that was posted, so failures can be spooled verbatim.
+        self.request_payload = request_payload
+        self.headers = headers or {}
+        # True when the request was never sent because the run deadline passed.
+        self.skipped = skipped
+
+    @classmethod
+    def skipped_at_deadline(cls, request_payload=None) -> "_HttpResponse":
+        return cls(
+            0, "Run deadline reached before sending.", request_payload, skipped=True
+        )
 
     def json(self):
-        return json.loads(self.text or "{}")
+        return loads(self.text or "{}")
+
+
+class _UrllibSession:
+    """Session-shaped adapter over urllib for when requests is not installed."""
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        request = urllib.request.Request(
+            url,
+            data=data,
+            headers=dict(headers or {}),
+            method="POST",
+        )
+
+        # urllib has a single socket timeout covering connect and each read.
+        if isinstance(timeout, tuple):
+            timeout = max(timeout)
+
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as resp:
+                return _HttpResponse(
+                    resp.getcode(), resp.read().decode("utf-8"), headers=resp.headers
+                )
+        except urllib.error.HTTPError as exc:
+            body = exc.read().decode("utf-8", errors="replace")
+            return _HttpResponse(exc.code, body, headers=exc.headers)
+        except urllib.error.URLError as exc:
+            return _HttpResponse(0, str(exc.reason))
+        except OSError as exc:  # socket timeouts raised while reading
+            return _HttpResponse(0, str(exc) or type(exc).__name__)
+
+
+def was_skipped(response) -> bool:
+    """
+    Whether a post was abandoned at the run deadline without reaching the API,
+    as opposed to a launch that was sent and failed.
+    """
+
+    return getattr(response, "skipped", False)
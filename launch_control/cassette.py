@@ -0,0 +1,168 @@
+"""
+Record live API traffic to a cassette and replay it offline.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional
+
+from .config import CASSETTE_MODES
+from .serialization import dumps, loads
+
+
+class RecordingSession:
+    """
+    Wrap a session and append every post to a cassette as it completes.
+
+    Each line of the cassette is one interaction: the request url and body,
+    the response status, text and headers (or the transport error), when the
+    request started relative to the first one, and how long it took. Request
+    headers are not recorded so API keys never end up on disk.
+    """
+
+    def __init__(self, session, path: Path):
+        self._session = session
+        self._stream = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._origin: Optional[float] = None
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        started = time.perf_counter()
+        with self._lock:
+            if self._origin is None:
+                self._origin = started
+
+        interaction: Dict[str, object] = {
+            "request": {"url": url, "body": _decode_body(data)},
+        }
+        try:
+            response = self._session.post(
+                url, headers=headers, data=data, timeout=timeout
+            )
+        except Exception as exc:
+            interaction["error"] = str(exc) or type(exc).__name__
+            self._write(interaction, started)
+            raise
+
+        headers = dict(getattr(response, "headers", None) or {})
+        interaction["response"] = {
+            "status": response.status_code,
+            "text": response.text,
+            "headers": {str(name): str(value) for name, value in headers.items()},
+        }
+        self._write(interaction, started)
+        return response
+
+    def _write(self, interaction: Dict[str, object], started: float) -> None:
+        interaction["started"] = round(started - self._origin, 6)
+        interaction["elapsed"] = round(time.perf_counter() - started, 6)
+        line = dumps(interaction) + "\n"
+        with self._lock:
+            self._stream.write(line)
+            self._stream.flush()
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class ReplaySession:
+    """
+    Serve recorded responses back in the order they were recorded.
+
+    Requests are not matched against the cassette (prompt bodies carry a fresh
+    uuid on every run); the n-th post gets the n-th recorded response, and the
+    cassette wraps around so a short recording can drive a longer benchmark.
+    Each response is delayed by its recorded latency times `latency_scale`;
+    0 replays as fast as possible.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        latency_scale: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.interactions = load_cassette(path)
+        if not self.interactions:
+            raise ValueError(f"Cassette {path} has no recorded interactions.")
+
+        self.latency_scale = latency_scale
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._position = 0
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        with self._lock:
+            interaction = self.interactions[self._position % len(self.interactions)]
+            self._position += 1
+
+        delay = interaction.get("elapsed", 0.0) * self.latency_scale
+        if delay > 0:
+            self._sleep(delay)
+
+        if "error" in interaction:
+            raise ConnectionError(interaction["error"])
+
+        response = interaction["response"]
+        return _ReplayedResponse(
+            response["status"], response["text"], response.get("headers")
+        )
+
+    def close(self) -> None:
+        pass
+
+
+def load_cassette(path: Path) -> List[Dict]:
+    """
+    Read the interactions recorded in a cassette file.
+    """
+
+    interactions = []
+    with open(path, "rb") as stream:
+        for line in stream:
+            if line.strip():
+                interactions.append(loads(line))
+    return interactions
+
+
+def cassette_session(mode: str, path: Path, session=None, latency_scale: float = 1.0):
+    """
+    Build the session for `--cassette-mode`: record wraps `session` (the
+    caller's live transport), replay reads `path` back.
+    """
+
+    if mode == "record":
+        return RecordingSession(session, Path(path))
+    if mode == "replay":
+        return ReplaySession(Path(path), latency_scale=latency_scale)
+    raise ValueError(
+        f"Unsupported cassette mode: {mode}. Use one of {', '.join(CASSETTE_MODES)}."
+    )
+
+
+class _ReplayedResponse:
+    """Response rebuilt from a cassette entry."""
+
+    def __init__(self, status_code: int, text: str, headers: Optional[Mapping] = None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = dict(headers or {})
+
+    def json(self):
+        return loads(self.text or "{}")
+
+
+def _decode_body(data) -> object:
+    """
+    Keep a JSON request body readable in the cassette.
+    """
+
+    if data is None:
+        return None
+    try:
+        return loads(data)
+    except ValueError:
+        if isinstance(data, bytes):
+            return data.decode("utf-8", errors="replace")
+        return data
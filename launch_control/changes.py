@@ -0,0 +1,88 @@
+"""
+Narrow a launch to the targets touched since a git ref.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Iterable, List, Mapping, Set
+
+from .discover import CACHE_DIR, SourceScanner
+from .targets import assemble_targets, explode_targets
+
+
+def changed_files(checkout: Path, ref: str) -> List[str]:
+    """
+    Paths changed between `ref` and the working tree, relative to `checkout`.
+    """
+
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", ref, "--"],
+            cwd=checkout,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except FileNotFoundError as exc:
+        raise RuntimeError("git is required for --changed-since.") from exc
+    except subprocess.CalledProcessError as exc:
+        raise ValueError(
+            f"Could not diff {checkout} against {ref}: {exc.stderr.strip()}"
+        ) from exc
+
+    return [line for line in result.stdout.splitlines() if line]
+
+
+class ChangeSet:
+    """
+    The modules and classes touched by a set of changed files.
+    """
+
+    def __init__(self, modules: Set[str], classes: Set[str]):
+        self.modules = modules
+        self.classes = classes
+
+    @classmethod
+    def from_paths(cls, scanner: SourceScanner, paths: Iterable[str]) -> "ChangeSet":
+        paths = list(paths)
+        modules = {scanner.module_for(path) for path in paths}
+        classes = {
+            parsed["name"]
+            for entry in scanner.scan_paths(paths).values()
+            for parsed in entry["classes"]
+        }
+        return cls(modules, classes)
+
+    def filter(self, targets: Iterable[Mapping], target_type: str) -> List[dict]:
+        """
+        Keep only target entries touched by the change set.
+
+        Class and function entries match on the changed class (every function
+        of a changed class is kept); module and scenario entries match on the
+        owning module of any changed file.
+        """
+
+        if target_type in ("class", "function"):
+            kept = [
+                key
+                for key in explode_targets(targets, target_type)
+                if key[1] in self.classes
+            ]
+        else:
+            kept = [
+                key
+                for key in explode_targets(targets, target_type)
+                if key[0] in self.modules
+            ]
+
+        return assemble_targets(kept, target_type)
+
+
+def load_change_set(stack: str, checkout: Path, ref: str) -> ChangeSet:
+    """
+    Diff `checkout` against `ref` and resolve the changed files through the
+    stack's cached source index.
+    """
+
+    scanner = SourceScanner(checkout, cache_path=CACHE_DIR / f"{stack}.json")
+    return ChangeSet.from_paths(scanner, changed_files(checkout, ref))
@@ -2,10 +2,25 @@
 CLI implementation for the devin launch control.
 """
 
+import os
+import sys
 from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import List, Optional
 
-from .config import STACK_CONFIG
-from .houston import MissionControl
+# Only the light modules are imported here: a launch handed to the daemon
+# never loads the API client, the renderer or the profilers. Everything else
+# is imported where it is used.
+from . import client
+from .config import (
+    CASSETTE_MODES,
+    DAEMON_SOCKET_ENV_VAR,
+    DEFAULT_DAEMON_SOCKET,
+    KEY_POLICIES,
+    PROFILE_MODES,
+    STACK_CONFIG,
+)
+from .pipeline import PIPELINE_DEPTH
 
 
 def _build_parser():
@@ -29,17 +44,15 @@ def _build_parser():
     parser.add_argument(
         "-t",
         "--type",
-        choices=["unit", "integration", "prompt"],
         default="unit",
-        help="The type of session to launch. (unit, integration, prompt)",
+        help="The type of session to launch, comma-separated to mix unit and integration. (unit, integration, prompt)",
     )
 
     parser.add_argument(
         "-tt",
         "--target-type",
-        choices=["module", "class", "function", "scenario"],
         default="class",
-        help="The target type to launch the session for, if the type is unit. (module, class, function)",
+        help="The target type(s) to launch sessions for, comma-separated. (module, class, function, scenario)",
     )
 
     parser.add_argument(
@@ -62,31 +75,461 @@ def _build_parser():
         "-d", "--debug", required=False, action="store_true", help="Enable debug mode."
     )
 
+    parser.add_argument(
+        "--progress",
+        required=False,
+        action="store_true",
+        help="Report throughput, in-flight count, error rate and ETA on stderr.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        required=False,
+        help="Write per-stage profiles (targets, render, launch) under this directory.",
+    )
+
+    parser.add_argument(
+        "--profile-mode",
+        default="cprofile,tracemalloc",
+        required=False,
+        help=f"Comma-separated profilers to run with --profile. ({', '.join(PROFILE_MODES)})",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--watch",
+        required=False,
+        action="store_true",
+        help="Keep running and launch only targets added to the target file.",
+    )
+
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        required=False,
+        help="Seconds between target file checks in watch mode. (default: 1.0)",
+    )
+
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=2.0,
+        required=False,
+        help="Seconds a target file must stay unchanged before it is diffed. (default: 2.0)",
+    )
+
+    parser.add_argument(
+        "--changed-since",
+        required=False,
+        help="Only launch targets whose sources changed since this git ref.",
+    )
+
+    parser.add_argument(
+        "--checkout",
+        required=False,
+        help="Path to the stack's checked-out repo for --changed-since. (default: ../<repo>)",
+    )
+
+    parser.add_argument(
+        "-r",
+        "--results",
+        required=False,
+        help="Stream one JSON line per launch to this file, or '-' for stdout.",
+    )
+
+    parser.add_argument(
+        "--dead-letter",
+        required=False,
+        help="Directory failed launches are spooled to. (default: prompts/dead_letter)",
+    )
+
+    parser.add_argument(
+        "--key-policy",
+        choices=list(KEY_POLICIES),
+        default="round-robin",
+        help="How requests are spread across DEVIN_API_KEYS. (default: round-robin)",
+    )
+
+    parser.add_argument(
+        "--key-rate",
+        type=float,
+        default=None,
+        help="Maximum requests per second for each API key. (default: unlimited)",
+    )
+
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for a connection to the Devin API. (default: 10)",
+    )
+
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for a Devin API response. (default: 60)",
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Stop launching after this many seconds and report what was skipped.",
+    )
+
+    parser.add_argument(
+        "--pipeline-depth",
+        type=int,
+        default=None,
+        help=f"Rendered prompts queued ahead of the launcher; 0 renders everything before the first launch. (default: {PIPELINE_DEPTH})",
+    )
+
+    parser.add_argument(
+        "--cassette",
+        default=None,
+        required=False,
+        help="Cassette file to record Devin API traffic to, or replay it from.",
+    )
+
+    parser.add_argument(
+        "--cassette-mode",
+        choices=CASSETTE_MODES,
+        default=None,
+        help="Record live traffic to --cassette or replay it offline. (default: replay)",
+    )
+
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=None,
+        help="Multiply recorded latencies during replay; 0 replays without delay. (default: 1)",
+    )
+
+    parser.add_argument(
+        "--socket",
+        default=None,
+        required=False,
+        help=f"Submit the launch to the daemon listening on this Unix socket. (env: {DAEMON_SOCKET_ENV_VAR})",
+    )
+
     return parser
 
 
+def _build_daemon_parser():
+    """
+    Configure and return the argument parser for the `daemon` command.
+    """
+
+    parser = ArgumentParser(
+        prog="devin-launch-control daemon",
+        description="Run a resident launch daemon that accepts jobs over a Unix socket.",
+    )
+
+    parser.add_argument(
+        "--socket",
+        default=os.getenv(DAEMON_SOCKET_ENV_VAR, DEFAULT_DAEMON_SOCKET),
+        help=f"Unix socket path to listen on. (default: {DEFAULT_DAEMON_SOCKET})",
+    )
+
+    return parser
+
+
+def _run_daemon(argv: List[str]) -> None:
+    """
+    Entry point for `devin-launch-control daemon`.
+    """
+
+    from .daemon import LaunchDaemon
+
+    args = _build_daemon_parser().parse_args(argv)
+    LaunchDaemon(args.socket).serve_forever()
+
+
+def _build_replay_parser():
+    """
+    Configure and return the argument parser for the `replay` command.
+    """
+
+    parser = ArgumentParser(
+        prog="devin-launch-control replay",
+        description="Re-send launches spooled to the dead-letter directory.",
+    )
+
+    parser.add_argument(
+        "--dead-letter",
+        required=False,
+        help="Directory failed launches are spooled to. (default: prompts/dead_letter)",
+    )
+
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of launches in flight at once. (default: 4)",
+    )
+
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="Maximum launches started per second. (default: unlimited)",
+    )
+
+    parser.add_argument(
+        "-l",
+        "--limit",
+        type=int,
+        default=None,
+        help="Replay at most this many spooled launches. (default: all)",
+    )
+
+    parser.add_argument(
+        "--key-policy",
+        choices=list(KEY_POLICIES),
+        default="round-robin",
+        help="How requests are spread across DEVIN_API_KEYS. (default: round-robin)",
+    )
+
+    parser.add_argument(
+        "--key-rate",
+        type=float,
+        default=None,
+        help="Maximum requests per second for each API key. (default: unlimited)",
+    )
+
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for a connection to the Devin API. (default: 10)",
+    )
+
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for a Devin API response. (default: 60)",
+    )
+
+    return parser
+
+
+def _run_replay(argv: List[str]) -> None:
+    """
+    Entry point for `devin-launch-control replay`.
+    """
+
+    from .api import DevinAPI
+    from .dead_letter import DeadLetterSpool, replay_spool
+
+    args = _build_replay_parser().parse_args(argv)
+    spool = DeadLetterSpool(args.dead_letter)
+
+    succeeded, failed = replay_spool(
+        spool,
+        DevinAPI(
+            key_policy=args.key_policy,
+            key_rate=args.key_rate,
+            connect_timeout=args.connect_timeout,
+            read_timeout=args.read_timeout,
+        ),
+        concurrency=args.concurrency,
+        rate=args.rate,
+        limit=args.limit,
+    )
+    print(f"Replay complete: {succeeded} launched, {failed} still failing.")
+    if failed:
+        raise SystemExit(1)
+
+
+def _build_discover_parser():
+    """
+    Configure and return the argument parser for the `discover` command.
+    """
+
+    parser = ArgumentParser(
+        prog="devin-launch-control discover",
+        description="Generate class and function targets by scanning a checkout.",
+    )
+
+    parser.add_argument(
+        "-s",
+        "--stack",
+        choices=list(STACK_CONFIG),
+        required=True,
+        help="The GitHub stack whose checkout is scanned. (asg, p2d, cle)",
+    )
+
+    parser.add_argument(
+        "--checkout",
+        required=False,
+        help="Path to the stack's checked-out repo. (default: ../<repo>)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of directories scanned in parallel. (default: 8)",
+    )
+
+    parser.add_argument(
+        "--include-tests",
+        action="store_true",
+        help="Also scan src/test source trees.",
+    )
+
+    return parser
+
+
+def _run_discover(argv: List[str]) -> None:
+    """
+    Entry point for `devin-launch-control discover`.
+    """
+
+    from .discover import discover
+
+    args = _build_discover_parser().parse_args(argv)
+    class_path, function_path = discover(
+        args.stack,
+        checkout=args.checkout,
+        workers=args.workers,
+        include_tests=args.include_tests,
+    )
+    print(f"Wrote {class_path}")
+    print(f"Wrote {function_path}")
+
+
+# Subcommands dispatched on the first CLI token; anything else is a launch.
+_COMMANDS = {
+    "daemon": _run_daemon,
+    "discover": _run_discover,
+    "replay": _run_replay,
+}
+
+
+def _split_list(value: str) -> List[str]:
+    """
+    Split a comma-separated option into its unique, non-empty parts, in order.
+    """
+
+    parts: List[str] = []
+    for part in str(value).split(","):
+        part = part.strip().lower()
+        if part and part not in parts:
+            parts.append(part)
+    return parts
+
+
 def _validate_args(args: Namespace) -> None:
     """
     Ensure the parsed arguments respect the documented bounds and relationships.
     """
 
-    if args.type not in ["unit", "integration", "prompt"]:
+    session_types = _split_list(args.type)
+    if not session_types or any(
+        session_type not in ["unit", "integration", "prompt"]
+        for session_type in session_types
+    ):
         raise ValueError(
             "Invalid session type. Must be one of: unit, integration, prompt."
         )
 
+    if "prompt" in session_types and len(session_types) > 1:
+        raise ValueError("Prompt sessions cannot be mixed with other session types.")
+
+    # Everything downstream compares against the normalised spelling.
+    args.type = ",".join(session_types)
+
     if args.type == "prompt" and not args.prompt:
         raise ValueError("Prompt is required when type is prompt.")
 
-    if args.type == "integration":
-        args.target_type = "scenario"
-    elif args.type == "unit":
+    if getattr(args, "watch", False) and args.type == "prompt":
+        raise ValueError("Watch mode requires a target-based session type.")
+
+    if getattr(args, "watch", False):
+        # The watcher launches each batch of new targets directly, so these
+        # would be accepted and then silently ignored.
+        unsupported = [
+            flag
+            for flag, option in (
+                ("--changed-since", "changed_since"),
+                ("--profile", "profile"),
+                ("--pipeline-depth", "pipeline_depth"),
+            )
+            if getattr(args, option, None) is not None
+        ]
+        if unsupported:
+            raise ValueError(f"Watch mode does not support {', '.join(unsupported)}.")
+
+    for option in ("connect_timeout", "read_timeout", "deadline"):
+        value = getattr(args, option, None)
+        if value is not None and value <= 0:
+            flag = option.replace("_", "-")
+            raise ValueError(f"--{flag} must be greater than zero.")
+
+    depth = getattr(args, "pipeline_depth", None)
+    if depth is not None and depth < 0:
+        raise ValueError("--pipeline-depth cannot be negative.")
+    # Left unset by the parser so an explicit depth can be told apart above.
+    args.pipeline_depth = PIPELINE_DEPTH if depth is None else depth
+
+    if getattr(args, "cassette_mode", None) and not getattr(args, "cassette", None):
+        raise ValueError("--cassette-mode requires --cassette.")
+
+    latency_scale = getattr(args, "latency_scale", None)
+    if latency_scale is not None and latency_scale < 0:
+        raise ValueError("--latency-scale cannot be negative.")
+
+    cassette = getattr(args, "cassette", None)
+    if cassette and getattr(args, "cassette_mode", None) != "record":
+        if not Path(cassette).is_file():
+            raise ValueError(f"Cassette {args.cassette} does not exist.")
+
+    if getattr(args, "changed_since", None) and args.type == "prompt":
+        raise ValueError("--changed-since requires a target-based session type.")
+
+    if getattr(args, "profile", None):
+        modes = _split_list(getattr(args, "profile_mode", None) or "cprofile")
+        unknown = [mode for mode in modes if mode not in PROFILE_MODES]
+        if unknown or not modes:
+            raise ValueError(
+                f"Profile mode must be one of: {', '.join(PROFILE_MODES)}."
+            )
+        args.profile_mode = modes
+
+    # Only an explicit --socket conflicts; $DEVIN_LAUNCH_SOCKET is skipped
+    # for watch mode, which always runs locally.
+    if getattr(args, "watch", False) and getattr(args, "socket", None):
+        raise ValueError("Watch mode runs locally and cannot be sent to the daemon.")
+
+    if session_types == ["integration"]:
+        args.target_types = ["scenario"]
+    elif "unit" in session_types:
         unit_targets = {"module", "class", "function"}
-        target_type = getattr(args, "target_type", "class")
-        if target_type not in unit_targets:
+        target_types = _split_list(getattr(args, "target_type", None) or "class")
+        for target_type in target_types:
+            if target_type in unit_targets:
+                continue
+            if target_type == "scenario" and "integration" in session_types:
+                continue
             raise ValueError(
                 "Target type must be one of module, class, or function for unit sessions."
             )
+        if "integration" in session_types and "scenario" not in target_types:
+            target_types.append("scenario")
+        args.target_types = target_types
+    else:
+        args.target_types = []
+
+    if args.target_types:
+        args.target_type = ",".join(args.target_types)
+
+    if getattr(args, "watch", False) and len(args.target_types) > 1:
+        raise ValueError("Watch mode follows a single target type.")
 
     try:
         stack_config = STACK_CONFIG[args.stack]
@@ -98,18 +541,58 @@ def _validate_args(args: Namespace) -> None:
         args.jira = stack_config["default_jira"]
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """
     Entry point: parse input, validate, load targets, and launch sessions.
     """
 
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv and argv[0] in _COMMANDS:
+        _COMMANDS[argv[0]](argv[1:])
+        return
+
     # Step: parse input.
     parser = _build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Step: validate input.
     _validate_args(args)
 
+    # Step: hand off to the resident daemon when one is configured.
+    if not getattr(args, "watch", False) and not getattr(args, "socket", None):
+        args.socket = os.getenv(DAEMON_SOCKET_ENV_VAR)
+    if getattr(args, "socket", None):
+        # The daemon resolves paths from its own working directory.
+        if args.results and args.results != "-":
+            args.results = os.path.abspath(args.results)
+        if args.dead_letter:
+            args.dead_letter = os.path.abspath(args.dead_letter)
+        if args.checkout:
+            args.checkout = os.path.abspath(args.checkout)
+        if args.profile:
+            args.profile = os.path.abspath(args.profile)
+        if args.cassette:
+            args.cassette = os.path.abspath(args.cassette)
+        try:
+            exit_code = client.submit(args.socket, args)
+        except client.DaemonUnavailable as exc:
+            print(
+                f"Launch daemon unavailable at {args.socket} ({exc}), launching locally."
+            )
+        else:
+            if exit_code:
+                raise SystemExit(exit_code)
+            return
+
     # Step: launch sessions.
+    from .houston import MissionControl
+    from .watch import TargetWatcher
+
     mc = MissionControl(args)
+    if getattr(args, "watch", False):
+        TargetWatcher(mc, interval=args.watch_interval, debounce=args.debounce).run()
+        return
+
     mc.launch()
@@ -0,0 +1,64 @@
+"""
+Thin client that submits a launch to the resident daemon.
+
+This module is on the CLI's hot path when a daemon is configured, so it
+imports nothing from the launch machinery.
+"""
+
+import json
+import socket
+import sys
+from argparse import Namespace
+
+
+class DaemonUnavailable(OSError):
+    """No launch daemon is accepting connections on the socket."""
+
+
+def submit(socket_path: str, args: Namespace, out=None, err=None) -> int:
+    """
+    Submit a validated launch to the daemon and echo its stdout to `out` and
+    its stderr to `err` as they stream. Returns the job's exit code.
+
+    Raises DaemonUnavailable only when the daemon cannot be reached, so the
+    caller can safely launch locally instead. Once the job has been sent the
+    daemon may already be posting prompts, so a connection lost after that
+    point is reported as a failed job rather than raised.
+    """
+
+    out = out if out is not None else sys.stdout
+    err = err if err is not None else sys.stderr
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError as exc:
+            raise DaemonUnavailable(str(exc)) from exc
+
+        try:
+            sock.sendall(json.dumps({"args": vars(args)}).encode("utf-8") + b"\n")
+
+            with sock.makefile("rb") as stream:
+                for raw in stream:
+                    message = json.loads(raw)
+                    if "line" in message:
+                        print(message["line"], file=out)
+                    if "err" in message:
+                        print(message["err"], file=err)
+                    if "error" in message:
+                        print(f"Launch failed: {message['error']}", file=out)
+                    if "exit" in message:
+                        return message["exit"]
+        except (OSError, ValueError) as exc:
+            print(
+                f"Lost connection to the launch daemon ({exc}); the job may have "
+                "partly run and was not relaunched locally.",
+                file=out,
+            )
+            return 1
+
+    print(
+        "Lost connection to the launch daemon before the job finished; "
+        "it was not relaunched locally.",
+        file=out,
+    )
+    return 1
@@ -2,6 +2,8 @@
 Shared configuration constants for the launch control package.
 """
 
+import tempfile
+from pathlib import Path
 from typing import Dict
 
 STACK_CONFIG: Dict[str, Dict[str, str]] = {
@@ -9,3 +11,13 @@ STACK_CONFIG: Dict[str, Dict[str, str]] = {
     "p2d": {"repo": "paper-to-digital-services", "default_jira": "P2D-1816"},
     "cle": {"repo": "tii-checklist-editor-services", "default_jira": "P2D-1793"},
 }
+
+# Unix socket the resident launch daemon listens on.
+DAEMON_SOCKET_ENV_VAR = "DEVIN_LAUNCH_SOCKET"
+DEFAULT_DAEMON_SOCKET = str(Path(tempfile.gettempdir()) / "devin-launch-control.sock")
+
+# Choices offered on the command line, kept here so building the parser does
+# not import the modules that use them.
+CASSETTE_MODES = ("record", "replay")
+KEY_POLICIES = ("round-robin", "least-loaded")
+PROFILE_MODES = ("cprofile", "tracemalloc", "sample")
@@ -0,0 +1,223 @@
+"""
+Resident launch daemon.
+
+The daemon keeps the Devin API client (and its connection pool), the
+rendered template cache and parsed target files warm between runs. Jobs
+arrive over a Unix socket as already validated CLI arguments, run one at a
+time from a shared queue, and stream their stdout and stderr back line by
+line. The client side lives in `client`, which stays cheap to import.
+"""
+
+import io
+import json
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+from argparse import Namespace
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Mapping, Optional
+
+from .api import DevinAPI
+from .client import DaemonUnavailable, submit  # noqa: F401 - re-exported
+from .houston import MissionControl
+
+
+class LaunchJob:
+    """
+    A queued launch request bound to the client connection that submitted it.
+    """
+
+    def __init__(self, args: Namespace, wfile):
+        self.args = args
+        self._wfile = wfile
+        self.connected = True
+        self.done = threading.Event()
+
+    def send(self, message: Mapping) -> None:
+        """
+        Stream a message to the client. A client that hangs up does not
+        cancel the job; the remaining output is dropped.
+        """
+
+        if not self.connected:
+            return
+        try:
+            self._wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+            self._wfile.flush()
+        except OSError:
+            self.connected = False
+
+
+class _JobOutput(io.TextIOBase):
+    """
+    Line-buffered text stream that forwards each line to the job's client,
+    tagged with `channel` ("line" for stdout, "err" for stderr).
+    """
+
+    def __init__(self, job: LaunchJob, channel: str = "line"):
+        self._job = job
+        self._channel = channel
+        self._buffer = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._buffer += text
+        while "\n" in self._buffer:
+            line, self._buffer = self._buffer.split("\n", 1)
+            self._job.send({self._channel: line})
+        return len(text)
+
+    def close(self) -> None:
+        if self._buffer:
+            self._job.send({self._channel: self._buffer})
+            self._buffer = ""
+        super().close()
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        launch_daemon = self.server.launch_daemon
+
+        line = self.rfile.readline()
+        if not line:
+            # A probe from a daemon checking whether the socket is live.
+            return
+
+        try:
+            request = json.loads(line)
+            args = Namespace(**request["args"])
+        except (ValueError, KeyError, TypeError) as exc:
+            self.wfile.write(
+                json.dumps({"error": f"Malformed job: {exc}", "exit": 2}).encode()
+                + b"\n"
+            )
+            return
+
+        job = LaunchJob(args, self.wfile)
+        waiting = launch_daemon.jobs.qsize()
+        if waiting:
+            job.send({"line": f"Queued behind {waiting} job(s)."})
+        launch_daemon.jobs.put(job)
+        job.done.wait()
+
+
+class _DaemonServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class LaunchDaemon:
+    """
+    Serve launch jobs over a Unix socket from a single resident process.
+    """
+
+    def __init__(self, socket_path: str, api: Optional[DevinAPI] = None):
+        self.socket_path = socket_path
+        self.api = api or DevinAPI()
+        self.jobs: "queue.Queue[Optional[LaunchJob]]" = queue.Queue()
+        self._server: Optional[_DaemonServer] = None
+        self._worker: Optional[threading.Thread] = None
+
+    def run_job(self, job: LaunchJob) -> None:
+        """
+        Run a single job with its output streamed to the submitting client.
+        """
+
+        # Keys benched or revoked by an earlier job get a fresh start.
+        key_pool = getattr(self.api, "key_pool", None)
+        if key_pool is not None:
+            key_pool.reset()
+
+        # Only the worker thread prints, so swapping stdout and stderr per job
+        # is safe. Both reach the client, e.g. the chatter `--results -` moves
+        # to stderr and `--progress` output.
+        output = _JobOutput(job)
+        errors = _JobOutput(job, channel="err")
+        exit_code = 0
+        try:
+            with redirect_stdout(output), redirect_stderr(errors):
+                MissionControl(job.args, api=self.api).launch()
+        except Exception as exc:  # report the failure to the client
+            exit_code = 1
+            output.close()
+            errors.close()
+            job.send({"error": str(exc)})
+        finally:
+            for stream in (output, errors):
+                if not stream.closed:
+                    stream.close()
+            job.send({"exit": exit_code})
+            job.done.set()
+
+    def _drain(self) -> None:
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            self.run_job(job)
+
+    def start(self) -> None:
+        """
+        Bind the socket and start the job worker without blocking.
+
+        A stale socket left by a daemon that died is replaced, but a live
+        daemon is never taken over. The socket is readable and writable by
+        its owner only, since jobs run with the daemon's API keys and write
+        files as the daemon's user.
+        """
+
+        if os.path.lexists(self.socket_path):
+            if not stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+                raise RuntimeError(f"{self.socket_path} exists and is not a socket.")
+            if _listening(self.socket_path):
+                raise RuntimeError(
+                    f"A launch daemon is already listening on {self.socket_path}."
+                )
+            os.unlink(self.socket_path)
+
+        self._server = _DaemonServer(self.socket_path, _JobHandler)
+        os.chmod(self.socket_path, 0o600)
+        self._server.launch_daemon = self
+        self._worker = threading.Thread(target=self._drain, daemon=True)
+        self._worker.start()
+
+    def serve_forever(self) -> None:
+        """
+        Start the daemon and serve until interrupted.
+        """
+
+        self.start()
+        print(f"Launch daemon listening on {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            print("Launch daemon stopped.")
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        if self._worker is not None:
+            self.jobs.put(None)
+            self._worker = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def _listening(socket_path: str) -> bool:
+    """
+    Whether something accepts connections on the Unix socket at `socket_path`.
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            return False
+    return True
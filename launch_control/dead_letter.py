@@ -0,0 +1,133 @@
+"""
+Dead-letter spool for launches the Devin API did not accept.
+"""
+
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+from .serialization import dumps, loads
+from .transport import RateLimiter, dispatch
+
+DEFAULT_SPOOL_DIR = Path(__file__).resolve().parent.parent / "prompts" / "dead_letter"
+
+
+def is_failure(response) -> bool:
+    """
+    A launch failed if the API answered with a non-2xx status, or not at all
+    (status 0 from a transport error).
+    """
+
+    return not 200 <= response.status_code < 300
+
+
+class DeadLetterSpool:
+    """
+    One JSON file per failed launch, holding the exact payload that was posted.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else DEFAULT_SPOOL_DIR
+
+    def add(
+        self,
+        payload: Mapping,
+        response,
+        source: Optional[str] = None,
+        target: Optional[Mapping] = None,
+    ) -> Path:
+        """
+        Persist a failed launch and return the spool entry's path.
+        """
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        now = datetime.now(timezone.utc)
+        entry = {
+            "spooled_at": now.isoformat(),
+            "source": source,
+            "target": dict(target) if target else None,
+            "payload": dict(payload),
+            "status": response.status_code,
+            "error": response.text,
+            "attempts": 1,
+        }
+
+        path = self.directory / f"{now:%Y%m%dT%H%M%S}_{uuid.uuid4().hex[:12]}.json"
+        self._write(path, entry)
+        return path
+
+    def entries(self) -> Iterator[Tuple[Path, Dict]]:
+        """
+        Yield `(path, entry)` for every spooled launch, oldest first.
+        """
+
+        if not self.directory.exists():
+            return
+
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                yield path, loads(path.read_bytes())
+            except (OSError, ValueError) as exc:
+                print(f"Skipping unreadable dead letter {path}: {exc}")
+
+    def remove(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+
+    def update(self, path: Path, entry: Mapping, response) -> None:
+        """
+        Record another failed attempt for an existing entry.
+        """
+
+        updated = {
+            **entry,
+            "status": response.status_code,
+            "error": response.text,
+            "attempts": entry.get("attempts", 1) + 1,
+        }
+        self._write(path, updated)
+
+    @staticmethod
+    def _write(path: Path, entry: Mapping) -> None:
+        # Write then rename so a crash never leaves a half-written entry.
+        staging = path.with_suffix(".tmp")
+        staging.write_text(dumps(entry, indent=2), encoding="utf-8")
+        os.replace(staging, path)
+
+
+def replay_spool(
+    spool: DeadLetterSpool,
+    api,
+    concurrency: int = 4,
+    rate: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Re-send spooled payloads and drop each entry once it succeeds.
+    Returns the number of entries replayed successfully and still failing.
+    """
+
+    def pending():
+        for index, entry in enumerate(spool.entries()):
+            if limit is not None and index >= limit:
+                return
+            yield entry
+
+    def send(spooled: Tuple[Path, Dict]):
+        return api.post_payload(spooled[1]["payload"])
+
+    succeeded = failed = 0
+    for (path, entry), response in dispatch(
+        pending(), send, concurrency=concurrency, limiter=RateLimiter(rate)
+    ):
+        label = entry.get("source") or path.name
+        print(f"Replayed {label}: {response.status_code} {response.text}")
+        if is_failure(response):
+            spool.update(path, entry, response)
+            failed += 1
+        else:
+            spool.remove(path)
+            succeeded += 1
+
+    return succeeded, failed
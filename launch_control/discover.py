@@ -0,0 +1,326 @@
+"""
+Discover class and function targets by scanning a checked-out Java repo.
+"""
+
+import json
+import os
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config import STACK_CONFIG
+from .serialization import dumps_bytes, loads
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = PROJECT_ROOT / ".cache" / "discover"
+
+BUILD_FILES = ("pom.xml", "build.gradle", "build.gradle.kts")
+SKIP_DIRS = {"target", "build", "out", "node_modules", "bin"}
+
+# Bumped whenever parsing changes, so cached results from an older parser
+# are discarded instead of trusted.
+PARSER_VERSION = 2
+
+# Text blocks, string and char literals, and comments in one alternation, so
+# a single left-to-right pass sees whichever starts first: "/api/**" stays a
+# string and a quote inside a comment stays part of the comment.
+_LITERAL_OR_COMMENT_PATTERN = re.compile(
+    r'"""[\s\S]*?"""'
+    r'|"(?:\\.|[^"\\\n])*"'
+    r"|'(?:\\.|[^'\\\n])*'"
+    r"|/\*[\s\S]*?\*/"
+    r"|//[^\n]*"
+)
+_PACKAGE_PATTERN = re.compile(r"^\s*package\s+([\w.]+)\s*;", re.MULTILINE)
+_TYPE_PATTERN = re.compile(
+    r"\b(?:public\s+)(?:(?:abstract|final|sealed|non-sealed|static|strictfp)\s+)*"
+    r"(?:class|interface|enum|record|@interface)\s+(\w+)"
+)
+_METHOD_PATTERN = re.compile(
+    r"\bpublic\s+"
+    r"(?:(?:static|final|synchronized|abstract|default|native|strictfp)\s+)*"
+    r"(?:<[^;{}()]*?>\s+)?"
+    r"[\w.$]+(?:\s*<[^;{}()]*?>)?(?:\s*\[\s*\])*\s+"
+    r"(\w+)\s*\("
+)
+
+
+def default_checkout(stack: str) -> Path:
+    """
+    Where a stack's repo is expected when no checkout is given: a sibling of
+    this project named after the stack's repo.
+    """
+
+    return PROJECT_ROOT.parent / STACK_CONFIG[stack]["repo"]
+
+
+def parse_java_source(text: str, file_stem: str) -> List[Dict]:
+    """
+    Extract the public top-level type of a Java file and its public methods.
+
+    This is a deliberately light parse: comments and string literals are
+    blanked, then the package, public type and public method declarations
+    are matched. Constructors are skipped and overloads collapse to one name.
+    """
+
+    text = _LITERAL_OR_COMMENT_PATTERN.sub(_blank_literal_or_comment, text)
+
+    package_match = _PACKAGE_PATTERN.search(text)
+    package = package_match.group(1) if package_match else ""
+
+    type_names = [match.group(1) for match in _TYPE_PATTERN.finditer(text)]
+    if file_stem not in type_names:
+        return []
+
+    methods: List[str] = []
+    for match in _METHOD_PATTERN.finditer(text):
+        name = match.group(1)
+        if name not in type_names and name not in methods:
+            methods.append(name)
+
+    qualified_name = f"{package}.{file_stem}" if package else file_stem
+    return [{"name": qualified_name, "methods": methods}]
+
+
+def _blank_literal_or_comment(match: "re.Match[str]") -> str:
+    return " " if match.group(0).startswith("/") else '""'
+
+
+class SourceScanner:
+    """
+    Walk a source tree in parallel and parse each Java file once per change.
+
+    Parsed results are cached per file keyed on mtime and size, so a rescan
+    only re-reads files that changed since the previous run.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        cache_path: Optional[Path] = None,
+        workers: int = 8,
+        include_tests: bool = False,
+    ):
+        self.root = Path(root).resolve()
+        self.cache_path = cache_path
+        self.workers = workers
+        self.include_tests = include_tests
+        self.parsed = 0
+        self.cached = 0
+        self._lock = threading.Lock()
+        self._previous: Dict[str, Dict] = self._load_cache()
+        self._current: Dict[str, Dict] = {}
+        self._modules: Dict[Path, str] = {}
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            cache = loads(self.cache_path.read_bytes())
+        except ValueError:
+            return {}
+        if cache.get("root") != str(self.root):
+            return {}
+        if cache.get("version") != PARSER_VERSION:
+            return {}
+        return cache.get("files", {})
+
+    def _save_cache(self, files: Dict[str, Dict]) -> None:
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": PARSER_VERSION, "root": str(self.root), "files": files}
+        self.cache_path.write_bytes(dumps_bytes(payload))
+
+    def _parse_file(self, path: str, module: str, stat: os.stat_result) -> Dict:
+        relative = os.path.relpath(path, self.root)
+        cached = self._previous.get(relative)
+        if (
+            cached is not None
+            and cached["mtime_ns"] == stat.st_mtime_ns
+            and cached["size"] == stat.st_size
+        ):
+            with self._lock:
+                self.cached += 1
+            entry = {**cached, "module": module}
+        else:
+            with self._lock:
+                self.parsed += 1
+            with open(path, encoding="utf-8", errors="replace") as handle:
+                classes = parse_java_source(handle.read(), Path(path).stem)
+            entry = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "module": module,
+                "classes": classes,
+            }
+
+        self._current[relative] = entry
+        return entry
+
+    def _scan_dir(self, directory: str, module: str) -> List[Tuple[str, str]]:
+        """
+        Parse the Java files in one directory and return subdirectories to visit.
+        """
+
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return []
+
+        names = {entry.name for entry in entries}
+        if any(build_file in names for build_file in BUILD_FILES):
+            module = os.path.basename(directory)
+
+        skip_tests = not self.include_tests and os.path.basename(directory) == "src"
+        subdirs: List[Tuple[str, str]] = []
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.startswith(".") or entry.name in SKIP_DIRS:
+                    continue
+                if skip_tests and entry.name == "test":
+                    continue
+                subdirs.append((entry.path, module))
+            elif entry.name.endswith(".java") and entry.is_file():
+                self._parse_file(entry.path, module, entry.stat())
+
+        return subdirs
+
+    def scan(self) -> Dict[str, Dict]:
+        """
+        Scan the tree and return parse results keyed by path relative to root.
+        """
+
+        self._current = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(self._scan_dir, str(self.root), self.root.name)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for subdir, module in future.result():
+                        pending.add(pool.submit(self._scan_dir, subdir, module))
+
+        self._save_cache(self._current)
+        return self._current
+
+    def module_for(self, relative_path: str) -> str:
+        """
+        Name of the module owning a path: the nearest directory above it
+        holding a build file, or the root itself.
+        """
+
+        directory = (self.root / relative_path).parent
+        visited: List[Path] = []
+        module = self.root.name
+
+        while directory != self.root and self.root in directory.parents:
+            if directory in self._modules:
+                module = self._modules[directory]
+                break
+            visited.append(directory)
+            if any((directory / build_file).exists() for build_file in BUILD_FILES):
+                module = directory.name
+                break
+            directory = directory.parent
+
+        for seen in visited:
+            self._modules[seen] = module
+        return module
+
+    def scan_paths(self, relative_paths: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Parse only the given Java files, reusing cached results where the
+        file is unchanged. Paths that no longer exist are skipped.
+        """
+
+        results: Dict[str, Dict] = {}
+        for relative in relative_paths:
+            if not relative.endswith(".java"):
+                continue
+            path = self.root / relative
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            results[relative] = self._parse_file(
+                str(path), self.module_for(relative), stat
+            )
+
+        self._save_cache({**self._previous, **self._current})
+        return results
+
+
+def build_targets(files: Dict[str, Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Turn scan results into class and function target payloads.
+    """
+
+    classes_by_module: Dict[str, List[str]] = {}
+    function_targets: List[Dict] = []
+
+    for relative in sorted(files):
+        entry = files[relative]
+        for parsed in entry["classes"]:
+            classes_by_module.setdefault(entry["module"], []).append(parsed["name"])
+            if parsed["methods"]:
+                function_targets.append(
+                    {
+                        "module": entry["module"],
+                        "class": parsed["name"],
+                        "functions": parsed["methods"],
+                    }
+                )
+
+    class_targets = [
+        {"module": module, "classes": sorted(classes)}
+        for module, classes in sorted(classes_by_module.items())
+    ]
+    function_targets.sort(key=lambda target: (target["module"], target["class"]))
+    return class_targets, function_targets
+
+
+def discover(
+    stack: str,
+    checkout: Optional[Path] = None,
+    workers: int = 8,
+    include_tests: bool = False,
+) -> Tuple[Path, Path]:
+    """
+    Scan the stack's checkout and write its class and function target files.
+    Returns the paths of the written class and function target files.
+    """
+
+    root = Path(checkout) if checkout else default_checkout(stack)
+    if not root.is_dir():
+        raise FileNotFoundError(f"Checkout not found at {root}")
+
+    scanner = SourceScanner(
+        root,
+        cache_path=CACHE_DIR / f"{stack}.json",
+        workers=workers,
+        include_tests=include_tests,
+    )
+    files = scanner.scan()
+    class_targets, function_targets = build_targets(files)
+
+    written = []
+    for target_type, targets in (
+        ("class", class_targets),
+        ("function", function_targets),
+    ):
+        path = PROJECT_ROOT / "targets" / target_type / f"{stack}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(targets, indent=2) + "\n", encoding="utf-8")
+        written.append(path)
+
+    class_count = sum(len(target["classes"]) for target in class_targets)
+    function_count = sum(len(target["functions"]) for target in function_targets)
+    print(
+        f"Discovered {class_count} classes and {function_count} functions "
+        f"in {len(files)} files ({scanner.parsed} parsed, {scanner.cached} cached)."
+    )
+
+    return written[0], written[1]
@@ -0,0 +1,82 @@
+"""
+The flight recorder streams one machine-readable record per launch.
+"""
+
+import sys
+from datetime import datetime, timezone
+from typing import Mapping, Optional, TextIO, Tuple
+
+from .serialization import dumps
+
+
+class FlightRecorder:
+    """
+    Write one JSON line per launch as it happens.
+
+    Each record is flushed as soon as it is written and nothing is kept in
+    memory, so downstream tooling can tail the sink while the run is going.
+    """
+
+    def __init__(self, stream: TextIO, owns_stream: bool = False):
+        self._stream = stream
+        self._owns_stream = owns_stream
+
+    @classmethod
+    def open(cls, destination: str) -> "FlightRecorder":
+        """
+        Open a sink for a file path, appending, or stdout for "-".
+        """
+
+        if destination == "-":
+            return cls(sys.stdout)
+        return cls(open(destination, "a", encoding="utf-8"), owns_stream=True)
+
+    def record(
+        self,
+        source: str,
+        target: Optional[Mapping],
+        response,
+        latency: float,
+    ) -> None:
+        """
+        Append a record for a single launch attempt.
+        """
+
+        status_code = response.status_code
+        session_id, url = _session_details(response)
+
+        entry = {
+            "time": datetime.now(timezone.utc).isoformat(),
+            "source": source,
+            "target": dict(target) if target else None,
+            "status": status_code,
+            "ok": 200 <= status_code < 300,
+            "latency": round(latency, 4),
+            "session_id": session_id,
+            "url": url,
+        }
+        if not entry["ok"]:
+            entry["error"] = response.text
+
+        self._stream.write(dumps(entry) + "\n")
+        self._stream.flush()
+
+    def close(self) -> None:
+        if self._owns_stream:
+            self._stream.close()
+
+
+def _session_details(response) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Pull the session id and url out of a response body, if it has them.
+    """
+
+    try:
+        data = response.json()
+    except (AttributeError, ValueError):
+        return None, None
+
+    if not isinstance(data, Mapping):
+        return None, None
+
+    return data.get("session_id"), data.get("url")
@@ -2,13 +2,30 @@
 Houston is the core Mission Control of the devin launch control system.
 """
 
-import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
-from typing import Iterable, List, Mapping, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
-from .api import DevinAPI
+from .api import DevinAPI, was_skipped
+from .cassette import cassette_session
+from .changes import ChangeSet, load_change_set
 from .config import STACK_CONFIG
+from .dead_letter import DeadLetterSpool, is_failure
+from .discover import default_checkout
+from .flight_recorder import FlightRecorder
+from .pipeline import PIPELINE_DEPTH, RenderAhead
+from .profiling import NullProfiler, make_profiler
+from .progress import ProgressReporter
 from .rocket_fuel import RocketFuel
+from .serialization import dumps, loads
+from .targets import explode_targets
+
+# Parsed target files keyed by path, revalidated against mtime and size.
+_TARGET_CACHE: Dict[Path, Tuple[Tuple[int, int], list]] = {}
 
 
 class MissionControl:
@@ -16,8 +33,15 @@ class MissionControl:
     Houston is the core Mission Control of the devin launch control system.
     """
 
-    def __init__(self, args):
+    def __init__(self, args, api: Optional[DevinAPI] = None):
         self.args = args
+        self.api = api
+        self.recorder: Optional[FlightRecorder] = None
+        self.deadline: Optional[float] = None
+        self._change_set: Optional[ChangeSet] = None
+        self._change_set_lock = threading.Lock()
+        self.profiler = NullProfiler()
+        self._manifest: Dict[str, Mapping] = {}
 
         provided_repo = getattr(args, "repo", None)
         if provided_repo:
@@ -31,89 +55,446 @@ class MissionControl:
         self.repo = STACK_CONFIG[stack]["repo"]
         setattr(self.args, "repo", self.repo)
 
+    @property
+    def debugging(self) -> bool:
+        return bool(getattr(self.args, "debug", False))
+
     def debug(self, message: str):
         """
         Emit debug output when the debug flag is enabled.
         """
 
-        if getattr(self.args, "debug", False):
+        if self.debugging:
             print(message)
 
+    @contextmanager
+    def recording(self):
+        """
+        Open the results sink requested by `--results` for the duration of a run.
+        When results stream to stdout, progress chatter moves to stderr.
+        """
+
+        destination = getattr(self.args, "results", None)
+        if not destination or self.recorder is not None:
+            yield
+            return
+
+        self.recorder = FlightRecorder.open(destination)
+        try:
+            if destination == "-":
+                with redirect_stdout(sys.stderr):
+                    yield
+            else:
+                yield
+        finally:
+            self.recorder.close()
+            self.recorder = None
+
     def launch(self):
         """
         Go for launch! 🚀🚀🚀
         """
 
+        self.start_deadline()
+        self.profiler = make_profiler(self.args)
+        try:
+            with self.recording():
+                self._launch()
+        finally:
+            self.profiler.close()
+
+    def _launch(self):
         # What args are we working with?
         self.debug(f"Args: {self.args}")
 
         # Get the targets for the session
         print("Getting targets...")
-        targets = self.get_targets()
-        if targets:
-            self.debug("Targets:")
-            self.debug(json.dumps(targets, indent=2))
-        else:
-            self.debug("Targets: []")
-
-        # Build prompts from the targets
-        print("Building prompts...")
-        prompts = self.build_prompts(targets)
-        if prompts:
-            self.debug("Prompts:")
-            self.debug(json.dumps(prompts, indent=2))
-        else:
-            self.debug("Prompts: []")
+        with self.profiler.stage("targets"):
+            target_sets = self.get_target_sets()
+        # Only pay for the debug dump when it will be shown.
+        if self.debugging:
+            if target_sets:
+                self.debug("Targets:")
+                self.debug(dumps(dict(target_sets), indent=2))
+            else:
+                self.debug("Targets: []")
+
+        if getattr(self.args, "changed_since", None) and not any(
+            targets for _, targets in target_sets
+        ):
+            print(f"No targets changed since {self.args.changed_since}.")
+            return
 
-        self.launch_prompts(prompts)
+        if self.deadline_passed():
+            print("Deadline reached before any prompts were built, nothing launched.")
+            return
+
+        depth = getattr(self.args, "pipeline_depth", PIPELINE_DEPTH)
+        if depth:
+            # Render and launch together so the API is never idle while the
+            # rest of the prompts are built.
+            print("Building and launching prompts...")
+            with self.profiler.stage("pipeline"):
+                self.launch_pipelined(target_sets, depth)
+        else:
+            # Build prompts from the targets
+            print("Building prompts...")
+            with self.profiler.stage("render"):
+                prompts = self.build_prompt_sets(target_sets)
+            if self.debugging:
+                if prompts:
+                    self.debug("Prompts:")
+                    self.debug(dumps(prompts, indent=2))
+                else:
+                    self.debug("Prompts: []")
+
+            with self.profiler.stage("launch"):
+                self.launch_prompts(prompts)
 
         print("Houston, we have liftoff! 🚀🚀🚀")
 
-    def get_targets(self):
+    def launch_targets(self, targets: Iterable[Mapping]):
         """
-        Get the targets for the session.
+        Build and launch prompts for an already loaded set of targets.
         """
 
-        if self.args.type != "prompt":
-            target_path = (
-                Path(__file__).resolve().parent.parent
-                / "targets"
-                / self.args.target_type.lower()
-                / f"{self.args.stack.lower()}.json"
-            )
-            if not target_path.exists():
-                raise FileNotFoundError(
-                    f"Target configuration not found at {target_path}"
+        with self.recording():
+            self.launch_prompts(self.build_prompts(targets))
+
+    def launch_pipelined(
+        self,
+        target_sets: Iterable[Tuple[str, Iterable[Mapping]]],
+        depth: int = PIPELINE_DEPTH,
+    ):
+        """
+        Render prompts on a background thread and launch each one as soon as
+        it is written, keeping at most `depth` rendered prompts queued.
+        """
+
+        fuel = RocketFuel(self.args, self.repo)
+        self._manifest = fuel.manifest
+        total = fuel.count_prompt_sets(target_sets)
+
+        rendered = RenderAhead(
+            fuel.iter_prompt_sets(target_sets),
+            depth,
+            # cProfile only sees its own thread; fold rendering into the stage.
+            context=self.profiler.worker("pipeline"),
+        )
+        with rendered:
+            self.launch_prompts(rendered, total=total, warm_up=True)
+
+    def target_types(self) -> List[str]:
+        """
+        Target types requested for this run, in launch order.
+        """
+
+        target_types = getattr(self.args, "target_types", None)
+        return list(target_types) if target_types else [self.args.target_type]
+
+    def target_path(self, target_type: Optional[str] = None) -> Path:
+        """
+        Path of the target configuration for the current stack and a target type.
+        """
+
+        target_type = target_type or self.args.target_type
+        return (
+            Path(__file__).resolve().parent.parent
+            / "targets"
+            / target_type.lower()
+            / f"{self.args.stack.lower()}.json"
+        )
+
+    def get_targets(self) -> list:
+        """
+        Get the targets for the session, across every requested target type.
+        """
+
+        return [target for _, targets in self.get_target_sets() for target in targets]
+
+    def get_target_sets(self) -> List[Tuple[str, list]]:
+        """
+        Load the targets for every requested target type concurrently.
+        Returns `(target_type, targets)` pairs in the requested order.
+        """
+
+        if self.args.type == "prompt":
+            return []
+
+        target_types = self.target_types()
+        with ThreadPoolExecutor(max_workers=len(target_types)) as pool:
+            loaded = list(pool.map(self._load_targets, target_types))
+
+        return list(zip(target_types, loaded))
+
+    def _load_targets(self, target_type: str) -> list:
+        target_path = self.target_path(target_type)
+        if not target_path.exists():
+            raise FileNotFoundError(f"Target configuration not found at {target_path}")
+
+        targets = self._read_targets(target_path)
+        if getattr(self.args, "changed_since", None):
+            targets = self._changed_targets(targets, target_type)
+        return targets
+
+    def _changed_targets(self, targets: list, target_type: str) -> list:
+        """
+        Narrow the loaded targets to those touched since `--changed-since`.
+        """
+
+        ref = self.args.changed_since
+        changed = self.change_set().filter(targets, target_type)
+
+        total = len(explode_targets(targets, target_type))
+        kept = len(explode_targets(changed, target_type))
+        print(f"{kept} of {total} {target_type} entries changed since {ref}.")
+        return changed
+
+    def change_set(self) -> ChangeSet:
+        """
+        The files changed since `--changed-since`, diffed once per run.
+        """
+
+        with self._change_set_lock:
+            if self._change_set is None:
+                checkout = getattr(self.args, "checkout", None)
+                if checkout:
+                    checkout = Path(checkout)
+                else:
+                    checkout = default_checkout(self.args.stack)
+                if not checkout.is_dir():
+                    raise FileNotFoundError(f"Checkout not found at {checkout}")
+
+                self._change_set = load_change_set(
+                    self.args.stack, checkout, self.args.changed_since
                 )
-            return json.loads(target_path.read_text(encoding="utf-8"))
+            return self._change_set
+
+    @staticmethod
+    def _read_targets(target_path: Path) -> list:
+        stat = target_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _TARGET_CACHE.get(target_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-        return []
+        targets = loads(target_path.read_bytes())
+        _TARGET_CACHE[target_path] = (signature, targets)
+        return targets
 
     def build_prompts(self, targets: Iterable[Mapping]) -> List[str]:
         """
         Build prompts from the targets.
         """
 
+        return self.build_prompt_sets([(self.args.target_type, targets)])
+
+    def build_prompt_sets(self, target_sets: List[Tuple[str, list]]) -> List[str]:
+        """
+        Build one launch queue from several target types with a shared limit.
+        """
+
         fuel = RocketFuel(self.args, self.repo)
-        return fuel.build_prompts(targets)
+        prompts = fuel.build_prompt_sets(target_sets)
+        self._manifest = fuel.manifest
+        return prompts
+
+    def launch_prompts(
+        self,
+        prompts: Iterable[str],
+        total: Optional[int] = None,
+        warm_up: bool = False,
+    ):
+        """
+        Launch the prompts, stopping cleanly if the run deadline passes.
+
+        `prompts` may be a stream still being rendered, in which case `total`
+        is the expected count for progress reporting. With `warm_up`, a client
+        built here opens its connection while the first prompt renders.
+        """
 
-    def launch_prompts(self, prompts: List[str]):
+        if total is None:
+            prompts = list(prompts)
+            total = len(prompts)
+
+        if self.api is not None and not self._needs_own_client():
+            api, options = self.api, {}
+        else:
+            options = self._api_options()
+            api = DevinAPI(**options)
+            if warm_up:
+                api.warm_up()
+        cassette = options.get("session")
+        request_options = self._request_options()
+        spool = DeadLetterSpool(getattr(self.args, "dead_letter", None))
+
+        launched = failed = 0
+        not_launched: List[str] = []
+
+        progress = None
+        if getattr(self.args, "progress", False):
+            progress = ProgressReporter()
+            progress.start(total)
+        # A status line redrawn in place on the terminal replaces the
+        # per-prompt chatter, which would otherwise land in the middle of it.
+        chatty = progress is None or not (progress.interactive and _isatty(sys.stdout))
+        notify = progress.note if progress is not None else print
+
+        seen = unrendered = 0
+        try:
+            queued = iter(prompts)
+            for entry in queued:
+                seen += 1
+                if self.deadline_passed():
+                    if isinstance(prompts, RenderAhead):
+                        # Stop rendering: only prompts already written are
+                        # listed, the rest are counted from the targets.
+                        pending = prompts.cancel()
+                        unrendered = max(total - seen - len(pending), 0)
+                    else:
+                        pending = list(queued)
+                    not_launched.extend([entry, *pending])
+                    seen += len(pending)
+                    break
+
+                prompt_data = self._load_prompt(entry)
+                if prompt_data is None:
+                    if progress is not None:
+                        progress.skip()
+                    continue
+
+                prompt_text, source = prompt_data
+                if chatty:
+                    print(f"Launching prompt: {source}")
+
+                if progress is not None:
+                    progress.begin()
+                started = time.perf_counter()
+                response = api.post_prompt(prompt_text, **request_options)
+                latency = time.perf_counter() - started
+                if was_skipped(response):
+                    # Nothing reached the API: not a failure, and not spooled.
+                    notify(f"Deadline reached before {source} was sent.")
+                    if progress is not None:
+                        progress.cancel()
+                    not_launched.append(entry)
+                    continue
+
+                if chatty:
+                    print(f"Response: {response.status_code} {response.text}")
+                if progress is not None:
+                    progress.finish(not is_failure(response))
+
+                target = self._manifest.get(entry)
+                if self.recorder is not None:
+                    self.recorder.record(source, target, response, latency)
+
+                if is_failure(response):
+                    failed += 1
+                    payload = getattr(response, "request_payload", None) or {
+                        "prompt": prompt_text,
+                        "idempotent": True,
+                    }
+                    spooled = spool.add(payload, response, source=source, target=target)
+                    notify(f"Launch failed, spooled to {spooled}")
+                else:
+                    launched += 1
+        finally:
+            if progress is not None:
+                progress.close()
+            if cassette is not None:
+                cassette.close()
+
+        self._summarize(seen + unrendered, launched, failed, not_launched, unrendered)
+
+    def _summarize(
+        self,
+        total: int,
+        launched: int,
+        failed: int,
+        not_launched: List[str],
+        unrendered: int = 0,
+    ) -> None:
+        """
+        Report what was and was not launched.
+        """
+
+        print(f"Launched {launched} of {total} prompts ({failed} failed).")
+        skipped = len(not_launched) + unrendered
+        if skipped:
+            print(f"Deadline reached, {skipped} prompt(s) not launched:")
+            for entry in not_launched:
+                print(f"  {entry}")
+            if unrendered:
+                print(f"  ... and {unrendered} more that were never rendered.")
+
+    def start_deadline(self) -> None:
         """
-        Launch the prompts.
+        Start the `--deadline` clock for this run, if one was requested.
         """
 
-        api = DevinAPI()
+        seconds = getattr(self.args, "deadline", None)
+        self.deadline = time.monotonic() + seconds if seconds else None
 
-        for entry in prompts:
-            prompt_data = self._load_prompt(entry)
-            if prompt_data is None:
-                continue
+    def deadline_passed(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
 
-            prompt_text, source = prompt_data
-            print(f"Launching prompt: {source}")
+    def _needs_own_client(self) -> bool:
+        """
+        Whether this run needs a client of its own rather than the injected
+        one (the daemon's): a cassette must never reach the live API, and key
+        pool settings only take effect on a pool built with them.
+        """
 
-            response = api.post_prompt(prompt_text)
-            print(f"Response: {response.status_code} {response.text}")
+        if getattr(self.args, "cassette", None):
+            return True
+        if getattr(self.args, "key_rate", None) is not None:
+            return True
+        policy = getattr(self.args, "key_policy", None)
+        pool = getattr(self.api, "key_pool", None)
+        return policy is not None and policy != getattr(pool, "policy", policy)
+
+    def _request_options(self) -> Dict[str, float]:
+        """
+        Per-request options for `post_prompt`, so a shared client honours
+        this run's deadline and timeouts.
+        """
+
+        options: Dict[str, float] = {}
+        if self.deadline is not None:
+            options["deadline"] = self.deadline
+        for option in ("connect_timeout", "read_timeout"):
+            value = getattr(self.args, option, None)
+            if value is not None:
+                options[option] = value
+        return options
+
+    def _api_options(self) -> Dict[str, object]:
+        """
+        API client options taken from the CLI arguments that were supplied.
+        """
+
+        options: Dict[str, object] = {}
+        for option in ("key_policy", "key_rate", "connect_timeout", "read_timeout"):
+            value = getattr(self.args, option, None)
+            if value is not None:
+                options[option] = value
+
+        cassette = getattr(self.args, "cassette", None)
+        if cassette:
+            mode = getattr(self.args, "cassette_mode", None) or "replay"
+            live = DevinAPI.default_session() if mode == "record" else None
+            latency_scale = getattr(self.args, "latency_scale", None)
+            options["session"] = cassette_session(
+                mode,
+                Path(cassette),
+                session=live,
+                latency_scale=1.0 if latency_scale is None else latency_scale,
+            )
+            # A replay never reaches the API, so it needs no real credentials.
+            if mode == "replay" and not DevinAPI.configured_keys():
+                options["api_key"] = "cassette-replay"
+        return options
 
     def _load_prompt(self, entry: str) -> Optional[Tuple[str, str]]:
         """
@@ -144,3 +525,8 @@ class MissionControl:
             return None
 
         return prompt_text, str(prompt_path)
+
+
+def _isatty(stream) -> bool:
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
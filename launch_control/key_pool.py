@@ -0,0 +1,204 @@
+"""
+A pool of Devin API keys so launch volume spreads across several accounts.
+"""
+
+import itertools
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from .config import KEY_POLICIES
+from .transport import RateLimiter
+
+
+class PooledKey:
+    """
+    One credential with its own rate limit, load and health state.
+    """
+
+    def __init__(self, key: str, rate: Optional[float] = None, clock=time.monotonic):
+        self.key = key
+        self.limiter = RateLimiter(rate, clock=clock)
+        self.in_flight = 0
+        self.launched = 0
+        self.consecutive_failures = 0
+        self.benched_until = 0.0
+        self.revoked = False
+
+    @property
+    def label(self) -> str:
+        return f"...{self.key[-4:]}"
+
+
+class KeyPool:
+    """
+    Hand out API keys by policy and bench the ones the API pushes back on.
+
+    - 401/403 means the key is revoked: it is benched for the rest of the run,
+      unless it is the last usable key, which keeps being tried (a lone key
+      rejected once is more often a transient auth error than a dead key).
+    - 429 benches the key until its Retry-After (or the cooldown) passes.
+    - Repeated 5xx or transport failures bench the key for the cooldown.
+    """
+
+    FAILURE_THRESHOLD = 3
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        policy: str = "round-robin",
+        rate: Optional[float] = None,
+        cooldown: float = 60.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        if not keys:
+            raise ValueError("A key pool needs at least one API key.")
+        if policy not in KEY_POLICIES:
+            raise ValueError(f"Unsupported key policy: {policy}")
+
+        self.keys = [PooledKey(key, rate=rate, clock=clock) for key in keys]
+        self.policy = policy
+        self.cooldown = cooldown
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._rotation = itertools.cycle(range(len(self.keys)))
+
+    def _healthy(self, now: float) -> List[PooledKey]:
+        return [
+            key for key in self.keys if not key.revoked and key.benched_until <= now
+        ]
+
+    def _choose(self, healthy: List[PooledKey]) -> PooledKey:
+        if self.policy == "least-loaded":
+            return min(healthy, key=lambda key: (key.in_flight, key.launched))
+
+        while True:
+            candidate = self.keys[next(self._rotation)]
+            if candidate in healthy:
+                return candidate
+
+    def acquire(self, deadline: Optional[float] = None) -> Optional[PooledKey]:
+        """
+        Reserve a key for one request, waiting out benches if every key is
+        throttled. Returns None when `deadline` (a value of the pool's clock)
+        passes before a key frees up.
+        """
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                if deadline is not None and now >= deadline:
+                    return None
+                healthy = self._healthy(now)
+                if healthy:
+                    key = self._choose(healthy)
+                    key.in_flight += 1
+                    break
+
+                # At least one key is never revoked, see release().
+                benched = [key for key in self.keys if not key.revoked]
+                wait = min(key.benched_until for key in benched) - now
+                if deadline is not None:
+                    wait = min(wait, deadline - now)
+
+            self._sleep(max(wait, 0.0))
+
+        key.limiter.acquire()
+        return key
+
+    def reset(self) -> None:
+        """
+        Forget every key's benches and revocations, e.g. between the jobs of a
+        long-lived daemon so one run's failures do not carry into the next.
+        """
+
+        with self._lock:
+            for key in self.keys:
+                key.revoked = False
+                key.benched_until = 0.0
+                key.consecutive_failures = 0
+
+    def cancel(self, key: PooledKey) -> None:
+        """
+        Return a key that was acquired but never used.
+        """
+
+        with self._lock:
+            key.in_flight -= 1
+
+    def release(self, key: PooledKey, response) -> None:
+        """
+        Return a key after its request and update its health from the response.
+        """
+
+        status = response.status_code
+        with self._lock:
+            key.in_flight -= 1
+            key.launched += 1
+
+            if 200 <= status < 300:
+                key.consecutive_failures = 0
+                return
+
+            if status in (401, 403):
+                if any(other is not key and not other.revoked for other in self.keys):
+                    key.revoked = True
+                    print(
+                        f"API key {key.label} rejected ({status}), benched for this run."
+                    )
+                else:
+                    print(
+                        f"API key {key.label} rejected ({status}), "
+                        "still in use as the last usable key."
+                    )
+                return
+
+            if status == 429:
+                delay = _retry_after(response) or self.cooldown
+                key.benched_until = self._clock() + delay
+                print(f"API key {key.label} throttled, benched for {delay:.0f}s.")
+                return
+
+            if status == 0 or status >= 500:
+                key.consecutive_failures += 1
+                if key.consecutive_failures >= self.FAILURE_THRESHOLD:
+                    key.consecutive_failures = 0
+                    key.benched_until = self._clock() + self.cooldown
+                    print(
+                        f"API key {key.label} failing repeatedly, "
+                        f"benched for {self.cooldown:.0f}s."
+                    )
+
+
+def load_keys(keys_env_var: str, key_file_env_var: str) -> List[str]:
+    """
+    Read a comma-separated key list, or a key file with one key per line.
+    """
+
+    raw_keys = os.getenv(keys_env_var)
+    if raw_keys:
+        return [key.strip() for key in raw_keys.split(",") if key.strip()]
+
+    key_file = os.getenv(key_file_env_var)
+    if key_file:
+        lines = Path(key_file).read_text(encoding="utf-8").splitlines()
+        return [
+            line.strip()
+            for line in lines
+            if line.strip() and not line.strip().startswith("#")
+        ]
+
+    return []
+
+
+def _retry_after(response) -> Optional[float]:
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
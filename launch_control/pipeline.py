@@ -0,0 +1,129 @@
+"""
+Overlap prompt rendering with launching through a bounded queue.
+"""
+
+import queue
+import threading
+from contextlib import nullcontext
+from typing import (
+    ContextManager,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+Item = TypeVar("Item")
+
+# Rendered prompts allowed to wait for the launcher before rendering pauses.
+PIPELINE_DEPTH = 8
+
+_DONE = object()
+
+
+class _Failed:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class RenderAhead(Generic[Item]):
+    """
+    Pull `items` on a background thread, staying at most `depth` items ahead
+    of the consumer.
+
+    Iterating yields the items in order as soon as each is produced, so the
+    launcher can send the first prompt while the rest are still rendering.
+    When the queue is full the producer blocks, which bounds memory to
+    `depth` rendered prompts. An exception raised while producing is re-raised
+    to the consumer in place of the item it failed on. Closing stops the
+    producer early, e.g. when the consumer gives up at a deadline.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Item],
+        depth: int = PIPELINE_DEPTH,
+        context: Optional[ContextManager] = None,
+    ):
+        if depth < 1:
+            raise ValueError("The pipeline depth must be at least 1.")
+
+        self._items = items
+        # Entered on the producer thread around all of its work, e.g. a
+        # profiler hook that has to run on the thread it measures.
+        self._context = context if context is not None else nullcontext()
+        self._queue: "queue.Queue" = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "RenderAhead[Item]":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._produce, name="render-ahead", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _produce(self) -> None:
+        with self._context:
+            try:
+                for item in self._items:
+                    if not self._put(item):
+                        return
+            except BaseException as exc:  # handed to the consumer, not lost here
+                self._put(_Failed(exc))
+                return
+            self._put(_DONE)
+
+    def _put(self, item) -> bool:
+        # Poll so a producer blocked on a full queue still notices close().
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __iter__(self) -> Iterator[Item]:
+        self.start()
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failed):
+                raise item.error
+            yield item
+
+    def close(self) -> None:
+        """
+        Stop the producer and wait for it to exit.
+        """
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def cancel(self) -> List[Item]:
+        """
+        Stop the producer and return the items it had queued but not handed
+        out yet. Nothing further is produced.
+        """
+
+        self.close()
+        pending: List[Item] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return pending
+            if item is not _DONE and not isinstance(item, _Failed):
+                pending.append(item)
+
+    def __enter__(self) -> "RenderAhead[Item]":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
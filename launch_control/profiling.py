@@ -0,0 +1,241 @@
+"""
+Per-stage profiling hooks for the launch pipeline.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from .config import PROFILE_MODES
+
+DEFAULT_PROFILE_MODES = ("cprofile", "tracemalloc")
+
+
+class StageProfiler:
+    """
+    Profile named pipeline stages and write one set of reports per stage.
+
+    - cprofile: `<stage>.prof` (load with pstats/snakeviz) and `<stage>.txt`
+      with the top functions by cumulative time. The calling thread is
+      profiled, plus any worker threads that wrap their work in `worker()`.
+    - tracemalloc: `<stage>.alloc.txt` with the top allocation sites that
+      grew during the stage.
+    - sample: `<stage>.samples.txt` with collapsed stacks from every thread,
+      sampled every `sample_interval` seconds (flamegraph.pl compatible).
+
+    `summary.json` records the wall time of each stage.
+    """
+
+    TOP_FUNCTIONS = 40
+    TOP_ALLOCATIONS = 25
+
+    def __init__(
+        self,
+        output_dir: Path,
+        modes: Sequence[str] = DEFAULT_PROFILE_MODES,
+        sample_interval: float = 0.005,
+    ):
+        unknown = set(modes) - set(PROFILE_MODES)
+        if unknown:
+            raise ValueError(
+                f"Unsupported profile mode(s): {', '.join(sorted(unknown))}"
+            )
+
+        self.run_dir = Path(output_dir) / datetime.now().strftime("run_%Y%m%dT%H%M%S")
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.modes = tuple(modes)
+        self.sample_interval = sample_interval
+        self.timings: Dict[str, float] = {}
+        self._workers: Dict[str, List[cProfile.Profile]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Profile the body of the `with` block as stage `name`.
+        """
+
+        profiler = cProfile.Profile() if "cprofile" in self.modes else None
+        sampler = None
+        if "sample" in self.modes:
+            sampler = _StackSampler(self.sample_interval)
+
+        started_tracing = False
+        before = None
+        if "tracemalloc" in self.modes:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+                started_tracing = True
+            before = tracemalloc.take_snapshot()
+
+        if sampler is not None:
+            sampler.start()
+        if profiler is not None:
+            profiler.enable()
+        started = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if profiler is not None:
+                profiler.disable()
+            if sampler is not None:
+                sampler.stop()
+
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+
+            if profiler is not None:
+                with self._lock:
+                    workers = self._workers.pop(name, [])
+                self._write_cprofile(name, profiler, workers)
+            if before is not None:
+                self._write_allocations(name, before, tracemalloc.take_snapshot())
+                if started_tracing:
+                    tracemalloc.stop()
+            if sampler is not None:
+                self._write_samples(name, sampler.samples)
+
+    @contextmanager
+    def worker(self, stage: str) -> Iterator[None]:
+        """
+        Profile work a stage runs on another thread, e.g. the render-ahead
+        producer. It is merged into the stage's cProfile report, so the body
+        must finish before the stage does.
+        """
+
+        if "cprofile" not in self.modes:
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ allows one active profiler per interpreter, and the
+            # stage's own profiler then already sees every thread.
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            profiler.disable()
+            with self._lock:
+                self._workers.setdefault(stage, []).append(profiler)
+
+    def _write_cprofile(
+        self,
+        name: str,
+        profiler: cProfile.Profile,
+        workers: Sequence[cProfile.Profile] = (),
+    ) -> None:
+        report = io.StringIO()
+        stats = pstats.Stats(profiler, stream=report)
+        for worker in workers:
+            stats.add(worker)
+        stats.dump_stats(str(self.run_dir / f"{name}.prof"))
+
+        stats.sort_stats("cumulative").print_stats(self.TOP_FUNCTIONS)
+        (self.run_dir / f"{name}.txt").write_text(report.getvalue(), encoding="utf-8")
+
+    def _write_allocations(self, name: str, before, after) -> None:
+        lines = [f"Top {self.TOP_ALLOCATIONS} allocation sites for stage '{name}':"]
+        for stat in after.compare_to(before, "lineno")[: self.TOP_ALLOCATIONS]:
+            lines.append(str(stat))
+
+        current, peak = tracemalloc.get_traced_memory()
+        lines.append("")
+        lines.append(f"Traced memory: current {current} B, peak {peak} B")
+        (self.run_dir / f"{name}.alloc.txt").write_text(
+            "\n".join(lines) + "\n", encoding="utf-8"
+        )
+
+    def _write_samples(self, name: str, samples: Counter) -> None:
+        lines = [f"{stack} {count}" for stack, count in samples.most_common()]
+        (self.run_dir / f"{name}.samples.txt").write_text(
+            "\n".join(lines) + "\n", encoding="utf-8"
+        )
+
+    def close(self) -> None:
+        """
+        Write the stage timing summary and say where the reports are.
+        """
+
+        summary = {"modes": list(self.modes), "stages": self.timings}
+        (self.run_dir / "summary.json").write_text(
+            json.dumps(summary, indent=2), encoding="utf-8"
+        )
+        print(f"Profiles written to {self.run_dir}")
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; stages cost nothing."""
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        yield
+
+    @contextmanager
+    def worker(self, stage: str) -> Iterator[None]:
+        yield
+
+    def close(self) -> None:
+        pass
+
+
+class _StackSampler:
+    """Background thread counting the stacks of every other thread."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+
+def make_profiler(args):
+    """
+    Build the profiler requested by `--profile`/`--profile-mode`, if any.
+    """
+
+    output_dir = getattr(args, "profile", None)
+    if not output_dir:
+        return NullProfiler()
+
+    modes = getattr(args, "profile_mode", None) or DEFAULT_PROFILE_MODES
+    if isinstance(modes, str):
+        modes = [mode.strip() for mode in modes.split(",") if mode.strip()]
+    return StageProfiler(Path(output_dir), modes)
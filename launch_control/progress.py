@@ -0,0 +1,161 @@
+"""
+Launch progress telemetry: throughput, in-flight count, error rate and ETA.
+"""
+
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+
+class ProgressReporter:
+    """
+    Track launch progress and render it without slowing the launch loop.
+
+    Counters are updated on every launch, but output is throttled. On a
+    terminal a single status line is redrawn in place; otherwise a plain log
+    line is written every `log_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        refresh_interval: float = 0.2,
+        log_interval: float = 10.0,
+        clock=time.monotonic,
+    ):
+        self.stream = stream if stream is not None else sys.stderr
+        isatty = getattr(self.stream, "isatty", None)
+        self.interactive = bool(isatty and isatty())
+        self.interval = refresh_interval if self.interactive else log_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self._started_at = 0.0
+        self._last_render = 0.0
+
+    def start(self, total: int) -> None:
+        with self._lock:
+            self.total = total
+            self.completed = self.failed = self.in_flight = 0
+            self._started_at = self._clock()
+            self._last_render = self._started_at
+
+    def begin(self) -> None:
+        """
+        A launch request has been sent.
+        """
+
+        with self._lock:
+            self.in_flight += 1
+        self._maybe_render()
+
+    def finish(self, ok: bool) -> None:
+        """
+        A launch request has returned.
+        """
+
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+            if not ok:
+                self.failed += 1
+        self._maybe_render()
+
+    def cancel(self) -> None:
+        """
+        A launch request was abandoned before it was sent.
+        """
+
+        with self._lock:
+            self.in_flight -= 1
+        self._maybe_render()
+
+    def skip(self) -> None:
+        """
+        A prompt was dropped before launch and no longer counts toward the total.
+        """
+
+        with self._lock:
+            self.total -= 1
+
+    def summary(self) -> str:
+        with self._lock:
+            elapsed = max(self._clock() - self._started_at, 1e-9)
+            total, completed = self.total, self.completed
+            failed, in_flight = self.failed, self.in_flight
+
+        rate = completed / elapsed
+        percent = 100.0 * completed / total if total else 100.0
+        error_rate = 100.0 * failed / completed if completed else 0.0
+        remaining = total - completed
+        if not remaining:
+            eta = "0s"
+        elif rate:
+            eta = _format_duration(remaining / rate)
+        else:
+            eta = "--"
+
+        width = len(str(total))
+        return (
+            f"[{completed:>{width}}/{total}] {percent:5.1f}%  "
+            f"{rate:.2f}/s  in-flight {in_flight}  "
+            f"errors {failed} ({error_rate:.1f}%)  ETA {eta}"
+        )
+
+    def _maybe_render(self) -> None:
+        now = self._clock()
+        with self._lock:
+            if now - self._last_render < self.interval:
+                return
+            self._last_render = now
+        self._render()
+
+    def _render(self, final: bool = False) -> None:
+        line = self.summary()
+        if self.interactive:
+            self.stream.write(f"\r\033[K{line}")
+            if final:
+                self.stream.write("\n")
+        else:
+            self.stream.write(f"Progress: {line}\n")
+        self.stream.flush()
+
+    def note(self, message: str, stream: Optional[TextIO] = None) -> None:
+        """
+        Print a line (to stdout by default) without tearing the status line:
+        on a terminal the status line is cleared first and redrawn after.
+        """
+
+        stream = stream if stream is not None else sys.stdout
+        if not self.interactive:
+            print(message, file=stream)
+            return
+
+        self.stream.write("\r\033[K")
+        self.stream.flush()
+        print(message, file=stream)
+        stream.flush()
+        self._render()
+
+    def close(self) -> None:
+        """
+        Render the final state.
+        """
+
+        self._render(final=True)
+
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(seconds + 0.5)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{seconds:02d}s"
+    return f"{seconds}s"
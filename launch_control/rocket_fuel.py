@@ -2,8 +2,26 @@
 Rocket fuel handles mixing the prompt payloads before launch.
 """
 
+import itertools
 from pathlib import Path
-from typing import Iterable, List, Mapping, Optional
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .targets import explode_targets
+
+# Template text keyed by path, revalidated against the file's mtime so a
+# long-lived process (watch mode, the launch daemon) only re-reads on change.
+_TEMPLATE_CACHE: Dict[Path, Tuple[int, str]] = {}
+
+
+def _read_template(path: Path) -> str:
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    text = path.read_text(encoding="utf-8")
+    _TEMPLATE_CACHE[path] = (mtime_ns, text)
+    return text
 
 
 class RocketFuel:
@@ -17,6 +35,8 @@ class RocketFuel:
         self.project_root = Path(__file__).resolve().parent.parent
         self.launch_pad_dir = self.project_root / "prompts" / "launch_pad"
         self.limit = self._parse_limit(getattr(args, "limit", None))
+        # Prompt file path -> target identity, filled in as prompts are written.
+        self.manifest: Dict[str, Dict[str, str]] = {}
         self._prepare_launch_pad()
 
     @staticmethod
@@ -43,60 +63,100 @@ class RocketFuel:
         for stale_prompt in self.launch_pad_dir.glob("prompt_*.txt"):
             stale_prompt.unlink()
 
-    def build_prompts(self, targets: Iterable[Mapping]) -> List[str]:
+    def build_prompts(
+        self, targets: Iterable[Mapping], target_type: Optional[str] = None
+    ) -> List[str]:
         """
         Build prompts from the provided targets and command arguments.
         """
 
+        target_type = target_type or getattr(self.args, "target_type", None)
+        return self.build_prompt_sets([(target_type, targets)])
+
+    def build_prompt_sets(
+        self, target_sets: Iterable[Tuple[str, Iterable[Mapping]]]
+    ) -> List[str]:
+        """
+        Build one launch queue from several `(target_type, targets)` sets.
+        The limit applies to the combined queue.
+        """
+
+        return list(self.iter_prompt_sets(target_sets))
+
+    def iter_prompt_sets(
+        self, target_sets: Iterable[Tuple[str, Iterable[Mapping]]]
+    ) -> Iterator[str]:
+        """
+        Render, write and yield prompt files one at a time, in launch order,
+        so a launcher can start on the first prompt while the rest render.
+        The manifest entry for a prompt is recorded before it is yielded.
+        """
+
         if self.limit == 0:
-            return []
+            return
 
         if self.args.type == "prompt":
-            template = (self.project_root / "prompts" / "custom.txt").read_text(
-                encoding="utf-8"
-            )
-            prompt = template.format(
+            template = _read_template(self.project_root / "prompts" / "custom.txt")
+            yield template.format(
                 REPO=self.repo,
                 OBJECTIVE=self.args.prompt,
                 JIRA_TICKET=self.args.jira,
             )
-            return [prompt]
+            return
 
-        template = (self.project_root / "prompts" / "playbook.txt").read_text(
-            encoding="utf-8"
+        template = _read_template(self.project_root / "prompts" / "playbook.txt")
+
+        rendered = (
+            entry
+            for target_type, targets in target_sets
+            for entry in self._render(template, targets, target_type)
         )
 
-        base_context = {
-            "REPO": self.repo,
-            "JIRA_TICKET": self.args.jira,
-        }
+        written = 0
+        for index, (prompt, identity) in enumerate(
+            itertools.islice(rendered, self.limit), start=1
+        ):
+            destination = self.launch_pad_dir / f"prompt_{index:02d}.txt"
+            destination.write_text(prompt, encoding="utf-8")
+            self.manifest[str(destination)] = identity
+            written += 1
+            yield str(destination)
 
-        prompts: List[str] = []
+        if not written:
+            raise ValueError("No prompts were generated.")
 
-        def build_injections(parts: Iterable[str]) -> str:
-            filtered = [part for part in parts if part != ""]
-            lines: List[str] = []
+    def count_prompt_sets(
+        self, target_sets: Iterable[Tuple[str, Iterable[Mapping]]]
+    ) -> int:
+        """
+        How many prompts `iter_prompt_sets` will yield, without rendering any.
+        """
 
-            for index in range(0, len(filtered), 2):
-                key = filtered[index]
-                value = filtered[index + 1] if index + 1 < len(filtered) else ""
-                lines.append(key)
-                if value:
-                    lines.append(value)
-                if index + 2 < len(filtered):
-                    lines.append("")
+        if self.limit == 0:
+            return 0
 
-            return "\n".join(lines)
+        if self.args.type == "prompt":
+            return 1
 
-        target_type = getattr(self.args, "target_type", None)
+        total = sum(
+            len(explode_targets(targets, target_type))
+            for target_type, targets in target_sets
+        )
+        return total if self.limit is None else min(total, self.limit)
 
-        def should_stop() -> bool:
-            return self.limit is not None and len(prompts) >= self.limit
+    def _render(
+        self, template: str, targets: Iterable[Mapping], target_type: Optional[str]
+    ) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """
+        Lazily render `(prompt, target identity)` pairs for one target type.
+        """
 
-        for target in targets:
-            if should_stop():
-                break
+        base_context = {
+            "REPO": self.repo,
+            "JIRA_TICKET": self.args.jira,
+        }
 
+        for target in targets:
             module_name = target.get("module")
             if not module_name:
                 raise ValueError("Unit targets require a 'module' entry.")
@@ -106,23 +166,28 @@ class RocketFuel:
                     **base_context,
                     "PLAYBOOK": "!moduleunittest",
                     "OBJECTIVE": f"Add unit tests for the module {module_name}",
-                    "INJECTIONS": build_injections(["Module", module_name]),
+                    "INJECTIONS": _build_injections(["Module", module_name]),
+                }
+                yield template.format(**context), {
+                    "target_type": "module",
+                    "module": module_name,
                 }
-                prompts.append(template.format(**context))
 
             elif target_type == "class":
                 for class_name in target.get("classes", []):
-                    if should_stop():
-                        break
                     context = {
                         **base_context,
                         "PLAYBOOK": "!classunittest",
                         "OBJECTIVE": f"Add unit tests for the class {class_name}",
-                        "INJECTIONS": build_injections(
+                        "INJECTIONS": _build_injections(
                             ["Module", module_name, "", "Class", class_name]
                         ),
                     }
-                    prompts.append(template.format(**context))
+                    yield template.format(**context), {
+                        "target_type": "class",
+                        "module": module_name,
+                        "class": class_name,
+                    }
 
             elif target_type == "function":
                 class_name = target.get("class")
@@ -130,13 +195,11 @@ class RocketFuel:
                     raise ValueError("Function targets require a 'class' entry.")
 
                 for function_name in target.get("functions", []):
-                    if should_stop():
-                        break
                     context = {
                         **base_context,
                         "PLAYBOOK": "!methodunittest",
                         "OBJECTIVE": f"Add unit tests for the function {function_name}",
-                        "INJECTIONS": build_injections(
+                        "INJECTIONS": _build_injections(
                             [
                                 "Module",
                                 module_name,
@@ -149,36 +212,43 @@ class RocketFuel:
                             ]
                         ),
                     }
-                    prompts.append(template.format(**context))
+                    yield template.format(**context), {
+                        "target_type": "function",
+                        "module": module_name,
+                        "class": class_name,
+                        "function": function_name,
+                    }
 
             elif target_type == "scenario":
                 for scenario in target.get("scenarios", []):
-                    if should_stop():
-                        break
                     context = {
                         **base_context,
                         "PLAYBOOK": "!integrationtest",
                         "OBJECTIVE": f"Execute integration scenario {scenario}",
-                        "INJECTIONS": build_injections(
+                        "INJECTIONS": _build_injections(
                             ["Module", module_name, "", "Scenario", str(scenario)]
                         ),
                     }
-                    prompts.append(template.format(**context))
+                    yield template.format(**context), {
+                        "target_type": "scenario",
+                        "module": module_name,
+                        "scenario": str(scenario),
+                    }
             else:
                 raise ValueError(f"Unsupported target type: {target_type}")
 
-        if not prompts:
-            raise ValueError("No prompts were generated.")
-
-        limited_prompts = prompts
-        if self.limit is not None:
-            limited_prompts = prompts[: self.limit]
 
-        if not limited_prompts:
-            return []
+def _build_injections(parts: Iterable[str]) -> str:
+    filtered = [part for part in parts if part != ""]
+    lines: List[str] = []
 
-        for index, prompt in enumerate(limited_prompts, start=1):
-            destination = self.launch_pad_dir / f"prompt_{index:02d}.txt"
-            destination.write_text(prompt, encoding="utf-8")
+    for index in range(0, len(filtered), 2):
+        key = filtered[index]
+        value = filtered[index + 1] if index + 1 < len(filtered) else ""
+        lines.append(key)
+        if value:
+            lines.append(value)
+        if index + 2 < len(filtered):
+            lines.append("")
 
-        return [str(path) for path in sorted(self.launch_pad_dir.glob("prompt_*.txt"))]
+    return "\n".join(lines)
@@ -0,0 +1,51 @@
+"""
+JSON encoding and decoding with an accelerated backend when available.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def backend() -> str:
+    """
+    Name of the JSON backend in use.
+    """
+
+    return "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode JSON from text or raw bytes; bytes avoid a decode copy with orjson.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Encode an object straight to UTF-8 JSON bytes, e.g. for a request body.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """
+    Encode an object to a JSON string. Only an indent of 2 is accelerated;
+    other indents fall back to the standard library.
+    """
+
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=indent)
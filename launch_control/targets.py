@@ -0,0 +1,74 @@
+"""
+Target payload helpers shared by the launch control components.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+TargetKey = Tuple[str, ...]
+
+TARGET_TYPES = ("module", "class", "function", "scenario")
+
+
+def explode_targets(targets: Iterable[Mapping], target_type: str) -> List[TargetKey]:
+    """
+    Flatten target payloads into one key per launchable entry, in file order.
+
+    Keys are tuples of the module followed by the class, function or
+    scenario that would be rendered into a single prompt.
+    """
+
+    keys: List[TargetKey] = []
+
+    for target in targets:
+        module_name = target.get("module")
+        if not module_name:
+            raise ValueError("Unit targets require a 'module' entry.")
+
+        if target_type == "module":
+            keys.append((module_name,))
+        elif target_type == "class":
+            for class_name in target.get("classes", []):
+                keys.append((module_name, class_name))
+        elif target_type == "function":
+            class_name = target.get("class")
+            if not class_name:
+                raise ValueError("Function targets require a 'class' entry.")
+            for function_name in target.get("functions", []):
+                keys.append((module_name, class_name, function_name))
+        elif target_type == "scenario":
+            for scenario in target.get("scenarios", []):
+                keys.append((module_name, str(scenario)))
+        else:
+            raise ValueError(f"Unsupported target type: {target_type}")
+
+    return keys
+
+
+def assemble_targets(keys: Iterable[TargetKey], target_type: str) -> List[Dict]:
+    """
+    Rebuild target payloads from keys produced by `explode_targets`.
+
+    Entries are regrouped by module (and class for function targets) so the
+    result matches the schema `RocketFuel.build_prompts` consumes.
+    """
+
+    grouped: Dict[TargetKey, Dict] = {}
+
+    for key in keys:
+        if target_type == "module":
+            grouped.setdefault(key, {"module": key[0]})
+        elif target_type == "class":
+            entry = grouped.setdefault(key[:1], {"module": key[0], "classes": []})
+            entry["classes"].append(key[1])
+        elif target_type == "function":
+            entry = grouped.setdefault(
+                key[:2], {"module": key[0], "class": key[1], "functions": []}
+            )
+            entry["functions"].append(key[2])
+        elif target_type == "scenario":
+            entry = grouped.setdefault(key[:1], {"module": key[0], "scenarios": []})
+            entry["scenarios"].append(key[1])
+        else:
+            raise ValueError(f"Unsupported target type: {target_type}")
+
+    return list(grouped.values())
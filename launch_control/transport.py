@@ -0,0 +1,90 @@
+"""
+Concurrent, rate-limited dispatch of launch requests.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+
+class RateLimiter:
+    """
+    Space calls evenly so no more than `rate` start per second.
+    A rate of None (or zero) disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        if rate is not None and rate < 0:
+            raise ValueError("The rate must be zero or greater.")
+
+        self.interval = 1.0 / rate if rate else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until the caller may start its call.
+        """
+
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+
+        delay = slot - now
+        if delay > 0:
+            self._sleep(delay)
+
+
+def dispatch(
+    items: Iterable[Item],
+    send: Callable[[Item], Result],
+    concurrency: int = 4,
+    limiter: Optional[RateLimiter] = None,
+) -> Iterator[Tuple[Item, Result]]:
+    """
+    Send items on a worker pool and yield `(item, result)` pairs as they finish.
+
+    At most twice `concurrency` items are pulled from `items` ahead of the
+    workers, so a large or lazily produced input stays bounded in memory.
+    """
+
+    if concurrency < 1:
+        raise ValueError("The concurrency must be at least 1.")
+
+    limiter = limiter or RateLimiter()
+
+    def run(item: Item) -> Result:
+        limiter.acquire()
+        return send(item)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pending: Dict[Future, Item] = {}
+
+        for item in items:
+            pending[pool.submit(run, item)] = item
+            if len(pending) < concurrency * 2:
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
@@ -0,0 +1,139 @@
+"""
+Watch mode keeps Mission Control on station, launching targets as they appear.
+"""
+
+import time
+from typing import List, Optional, Set, Tuple
+
+from .rocket_fuel import RocketFuel
+from .serialization import loads
+from .targets import TargetKey, assemble_targets, explode_targets
+
+
+class TargetWatcher:
+    """
+    Poll a target file and launch only the entries added since the last look.
+
+    The file is considered settled once its size and modification time stay
+    unchanged for the debounce window, so a build rewriting it several times
+    in quick succession only triggers one diff.
+    """
+
+    def __init__(
+        self,
+        mission_control,
+        interval: float = 1.0,
+        debounce: float = 2.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.mission_control = mission_control
+        self.path = mission_control.target_path()
+        self.target_type = mission_control.args.target_type
+        self.interval = interval
+        self.debounce = debounce
+        self.limit = RocketFuel._parse_limit(
+            getattr(mission_control.args, "limit", None)
+        )
+        self._clock = clock
+        self._sleep = sleep
+
+        self.seen: Set[TargetKey] = set()
+        self._backlog: List[TargetKey] = []
+        self._signature: Optional[Tuple[int, int]] = None
+        self._pending_signature: Optional[Tuple[int, int]] = None
+        self._pending_since = 0.0
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_keys(self) -> Optional[List[TargetKey]]:
+        try:
+            targets = loads(self.path.read_bytes())
+            return explode_targets(targets, self.target_type)
+        except FileNotFoundError:
+            return None
+        except ValueError as exc:
+            print(f"Target file unreadable ({exc}), waiting for the next write.")
+            return None
+
+    def prime(self) -> None:
+        """
+        Treat everything currently in the target file as already launched.
+        """
+
+        self._signature = self._stat()
+        keys = self._read_keys()
+        if keys:
+            self.seen.update(keys)
+
+    def poll(self) -> int:
+        """
+        Check the target file once and launch any new entries.
+        Returns the number of entries launched.
+        """
+
+        signature = self._stat()
+        now = self._clock()
+
+        if signature != self._signature:
+            if signature != self._pending_signature:
+                self._pending_signature = signature
+                self._pending_since = now
+            elif now - self._pending_since >= self.debounce:
+                self._signature = signature
+                self._pending_signature = None
+                self._queue_new_keys()
+
+        return self._launch_backlog()
+
+    def _queue_new_keys(self) -> None:
+        keys = self._read_keys()
+        if not keys:
+            return
+
+        queued = set(self._backlog)
+        for key in keys:
+            if key in self.seen or key in queued:
+                continue
+            queued.add(key)
+            self._backlog.append(key)
+
+    def _launch_backlog(self) -> int:
+        batch = self._backlog if self.limit is None else self._backlog[: self.limit]
+        if not batch:
+            return 0
+
+        batch = list(batch)
+        print(f"Launching {len(batch)} new target(s) from {self.path}")
+        self.mission_control.launch_targets(assemble_targets(batch, self.target_type))
+
+        # Anything over the limit stays queued for the next poll.
+        self.seen.update(batch)
+        del self._backlog[: len(batch)]
+        return len(batch)
+
+    def run(self, max_polls: Optional[int] = None) -> None:
+        """
+        Watch until interrupted (or for `max_polls` iterations).
+        """
+
+        self.mission_control.start_deadline()
+        self.prime()
+        print(f"Watching {self.path} for new targets... (Ctrl+C to stop)")
+
+        polls = 0
+        try:
+            while max_polls is None or polls < max_polls:
+                if self.mission_control.deadline_passed():
+                    print("Deadline reached, watch stopped.")
+                    return
+                self.poll()
+                polls += 1
+                self._sleep(self.interval)
+        except KeyboardInterrupt:
+            print("Watch stopped.")
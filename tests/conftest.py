@@ -0,0 +1,39 @@
+import io
+
+import pytest
+
+
+class FakeClock:
+    """
+    A monotonic clock that only moves when a test sets `now` or sleeps on it.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TtyStream(io.StringIO):
+    """
+    In-memory text stream that reports itself as a terminal.
+    """
+
+    def isatty(self):
+        return True
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_tty_stream():
+    return TtyStream
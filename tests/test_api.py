@@ -1,8 +1,10 @@
+import json
+import time
 from types import SimpleNamespace
 
 import pytest
 
-from launch_control.api import DevinAPI
+from launch_control.api import DevinAPI, was_skipped
 
 
 def test_devin_api_requires_api_key(monkeypatch):
@@ -19,8 +21,9 @@ def test_post_prompt_uses_injected_session(monkeypatch):
         def __init__(self):
             self.calls = []
 
-        def post(self, url, headers, json):
-            self.calls.append((url, headers, json))
+        def post(self, url, headers, data, timeout):
+            self.calls.append((url, headers, json.loads(data)))
+            self.timeout = timeout
             return SimpleNamespace(status_code=201, text="created")
 
     session = DummySession()
@@ -37,3 +40,88 @@ def test_post_prompt_uses_injected_session(monkeypatch):
     assert headers["Authorization"] == "Bearer test-key"
     assert payload["idempotent"] is True
     assert payload["prompt"].startswith("Investigate outage")
+    assert session.timeout == (DevinAPI.CONNECT_TIMEOUT, DevinAPI.READ_TIMEOUT)
+
+
+def test_post_prompt_caps_timeouts_at_deadline(monkeypatch):
+    monkeypatch.setenv("DEVIN_API_KEY", "test-key")
+
+    class DummySession:
+        def post(self, url, headers, data, timeout):
+            self.timeout = timeout
+            return SimpleNamespace(status_code=201, text="created")
+
+    session = DummySession()
+    api = DevinAPI(session=session, connect_timeout=5, read_timeout=30)
+
+    api.post_prompt("Investigate outage", deadline=time.monotonic() + 2)
+
+    connect_timeout, read_timeout = session.timeout
+    assert 0 < connect_timeout <= 2
+    assert 0 < read_timeout <= 2
+
+
+def test_post_prompt_skips_send_after_deadline(monkeypatch):
+    monkeypatch.setenv("DEVIN_API_KEY", "test-key")
+
+    class DummySession:
+        def post(self, *args, **kwargs):  # pragma: no cover - must not be called
+            raise AssertionError("request sent after the deadline")
+
+    api = DevinAPI(session=DummySession())
+
+    response = api.post_prompt("Investigate outage", deadline=time.monotonic() - 1)
+
+    assert response.status_code == 0
+    assert "deadline" in response.text
+    assert was_skipped(response)
+
+
+def test_warm_up_opens_connection_without_credentials(monkeypatch):
+    monkeypatch.setenv("DEVIN_API_KEY", "test-key")
+
+    class DummySession:
+        def __init__(self):
+            self.heads = []
+
+        def head(self, url, **kwargs):
+            self.heads.append((url, kwargs))
+
+    session = DummySession()
+    api = DevinAPI(session=session)
+
+    api.warm_up().join(timeout=1)
+
+    assert len(session.heads) == 1
+    url, kwargs = session.heads[0]
+    assert url == api.api_url
+    assert "headers" not in kwargs
+
+
+def test_warm_up_skips_sessions_without_pooling(monkeypatch):
+    monkeypatch.setenv("DEVIN_API_KEY", "test-key")
+
+    api = DevinAPI(session=SimpleNamespace(post=None))
+
+    assert api.warm_up() is None
+
+
+def test_post_prompt_stops_waiting_for_benched_key_at_deadline(monkeypatch):
+    monkeypatch.setenv("DEVIN_API_KEY", "test-key")
+
+    class ThrottledSession:
+        def post(self, url, headers, data, timeout):
+            return SimpleNamespace(
+                status_code=429, text="slow down", headers={"Retry-After": "3600"}
+            )
+
+    api = DevinAPI(session=ThrottledSession())
+    api.post_prompt("First")
+
+    started = time.monotonic()
+    response = api.post_prompt("Second", deadline=started + 0.2)
+
+    assert time.monotonic() - started < 5
+    assert response.status_code == 0
+    assert "deadline" in response.text
+    assert was_skipped(response)
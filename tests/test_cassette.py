@@ -0,0 +1,167 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from launch_control.api import DevinAPI
+from launch_control.cassette import RecordingSession, ReplaySession, load_cassette
+from launch_control.houston import MissionControl
+
+
+class LiveSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def post(self, url, headers, data, timeout):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def test_recording_session_writes_interactions_without_credentials(tmp_path):
+    cassette = tmp_path / "run.jsonl"
+    live = LiveSession(
+        [
+            SimpleNamespace(
+                status_code=201, text='{"session_id": "s1"}', headers={"X-Id": "1"}
+            ),
+            ConnectionError("connection reset"),
+        ]
+    )
+    recorder = RecordingSession(live, cassette)
+    api = DevinAPI(api_key="secret-key", session=recorder)
+
+    assert api.post_prompt("First").status_code == 201
+    assert api.post_prompt("Second").status_code == 0
+    recorder.close()
+
+    first, second = load_cassette(cassette)
+    assert first["request"]["url"] == DevinAPI.API_URL
+    assert first["request"]["body"]["prompt"].startswith("First")
+    assert first["response"] == {
+        "status": 201,
+        "text": '{"session_id": "s1"}',
+        "headers": {"X-Id": "1"},
+    }
+    assert first["started"] == 0
+    assert first["elapsed"] >= 0
+    assert second["error"] == "connection reset"
+    assert "secret-key" not in cassette.read_text()
+
+
+def _write_cassette(path, interactions):
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in interactions))
+
+
+def test_replay_session_serves_recorded_responses_with_scaled_latency(tmp_path):
+    cassette = tmp_path / "run.jsonl"
+    _write_cassette(
+        cassette,
+        [
+            {
+                "request": {"url": DevinAPI.API_URL, "body": {}},
+                "response": {"status": 201, "text": "created", "headers": {}},
+                "started": 0,
+                "elapsed": 0.5,
+            },
+            {
+                "request": {"url": DevinAPI.API_URL, "body": {}},
+                "response": {
+                    "status": 429,
+                    "text": "slow down",
+                    "headers": {"Retry-After": "1"},
+                },
+                "started": 0.5,
+                "elapsed": 0.25,
+            },
+        ],
+    )
+    delays = []
+    replay = ReplaySession(cassette, latency_scale=2.0, sleep=delays.append)
+    api = DevinAPI(api_key="offline", session=replay)
+
+    statuses = [api.post_prompt(f"Prompt {n}").status_code for n in range(3)]
+
+    # The cassette wraps around once it runs out.
+    assert statuses == [201, 429, 201]
+    assert delays == [1.0, 0.5, 1.0]
+
+
+def test_replay_session_replays_transport_errors(tmp_path):
+    cassette = tmp_path / "run.jsonl"
+    _write_cassette(
+        cassette,
+        [{"request": {}, "error": "timed out", "started": 0, "elapsed": 0}],
+    )
+    replay = ReplaySession(cassette, latency_scale=0)
+
+    with pytest.raises(ConnectionError, match="timed out"):
+        replay.post(DevinAPI.API_URL, headers={}, data=b"{}", timeout=(1, 1))
+
+
+def test_replay_session_rejects_empty_cassette(tmp_path):
+    cassette = tmp_path / "empty.jsonl"
+    cassette.write_text("")
+
+    with pytest.raises(ValueError):
+        ReplaySession(cassette)
+
+
+def _replay_args(cassette, **overrides):
+    defaults = {
+        "stack": "asg",
+        "repo": "tii-assisted-grading-services",
+        "type": "prompt",
+        "target_type": None,
+        "prompt": "Investigate outage",
+        "jira": "P2D-123",
+        "limit": 5,
+        "debug": False,
+        "cassette": str(cassette),
+        "cassette_mode": "replay",
+        "latency_scale": None,
+    }
+    defaults.update(overrides)
+    return SimpleNamespace(**defaults)
+
+
+def _created_cassette(path):
+    _write_cassette(
+        path,
+        [
+            {
+                "request": {"url": DevinAPI.API_URL, "body": {}},
+                "response": {"status": 201, "text": "created", "headers": {}},
+                "started": 0,
+                "elapsed": 0.5,
+            }
+        ],
+    )
+    return path
+
+
+def test_cassette_jobs_ignore_an_injected_live_client(tmp_path, monkeypatch, capsys):
+    for name in ("DEVIN_API_KEY", "DEVIN_API_KEYS", "DEVIN_API_KEY_FILE"):
+        monkeypatch.delenv(name, raising=False)
+    cassette = _created_cassette(tmp_path / "run.jsonl")
+
+    class LiveAPI:
+        def post_prompt(self, prompt, deadline=None):  # pragma: no cover
+            raise AssertionError("a replay must not reach the live API")
+
+    # The daemon hands every job its shared, live client.
+    mc = MissionControl(_replay_args(cassette, latency_scale=0), api=LiveAPI())
+    mc.launch_prompts(["Replay me"])
+
+    assert "Response: 201 created" in capsys.readouterr().out
+
+
+def test_api_options_keep_a_zero_latency_scale(tmp_path):
+    cassette = _created_cassette(tmp_path / "run.jsonl")
+
+    zero = MissionControl(_replay_args(cassette, latency_scale=0))._api_options()
+    default = MissionControl(_replay_args(cassette))._api_options()
+
+    assert zero["session"].latency_scale == 0
+    assert default["session"].latency_scale == 1.0
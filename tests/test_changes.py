@@ -0,0 +1,92 @@
+import os
+import subprocess
+
+from launch_control.changes import ChangeSet, changed_files, load_change_set
+from launch_control.discover import SourceScanner
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        env={
+            **os.environ,
+            "GIT_AUTHOR_NAME": "test",
+            "GIT_AUTHOR_EMAIL": "test@example.com",
+            "GIT_COMMITTER_NAME": "test",
+            "GIT_COMMITTER_EMAIL": "test@example.com",
+            "HOME": str(repo),
+        },
+    )
+
+
+def _write(repo, relative, text):
+    path = repo / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _make_repo(tmp_path):
+    repo = tmp_path / "repo"
+    _write(repo, "core/pom.xml", "<project/>")
+    _write(repo, "api/pom.xml", "<project/>")
+    _write(repo, "core/src/main/java/a/Foo.java", "package a;\npublic class Foo {}\n")
+    _write(repo, "core/src/main/java/a/Bar.java", "package a;\npublic class Bar {}\n")
+    _write(repo, "api/src/main/java/b/Api.java", "package b;\npublic class Api {}\n")
+    _git(repo, "init", "-q")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "initial")
+    return repo
+
+
+def test_changed_files_lists_working_tree_changes(tmp_path):
+    repo = _make_repo(tmp_path)
+    _write(repo, "core/src/main/java/a/Foo.java", "package a;\npublic class Foo { }\n")
+
+    assert changed_files(repo, "HEAD") == ["core/src/main/java/a/Foo.java"]
+
+
+def test_change_set_filters_class_and_module_targets(tmp_path):
+    repo = _make_repo(tmp_path)
+    scanner = SourceScanner(repo)
+    change_set = ChangeSet.from_paths(
+        scanner, ["core/src/main/java/a/Foo.java", "api/pom.xml"]
+    )
+
+    class_targets = [
+        {"module": "core", "classes": ["a.Foo", "a.Bar"]},
+        {"module": "api", "classes": ["b.Api"]},
+    ]
+    module_targets = [{"module": "core"}, {"module": "api"}, {"module": "web"}]
+
+    assert change_set.filter(class_targets, "class") == [
+        {"module": "core", "classes": ["a.Foo"]}
+    ]
+    assert change_set.filter(module_targets, "module") == [
+        {"module": "core"},
+        {"module": "api"},
+    ]
+
+
+def test_change_set_keeps_functions_of_changed_classes(tmp_path, monkeypatch):
+    import launch_control.changes as changes
+
+    monkeypatch.setattr(changes, "CACHE_DIR", tmp_path / "cache")
+    repo = _make_repo(tmp_path)
+    _write(
+        repo,
+        "api/src/main/java/b/Api.java",
+        "package b;\npublic class Api { public void serve() {} }\n",
+    )
+
+    targets = [
+        {"module": "api", "class": "b.Api", "functions": ["serve", "stop"]},
+        {"module": "core", "class": "a.Foo", "functions": ["run"]},
+    ]
+
+    change_set = load_change_set("asg", repo, "HEAD")
+    assert change_set.filter(targets, "function") == [
+        {"module": "api", "class": "b.Api", "functions": ["serve", "stop"]}
+    ]
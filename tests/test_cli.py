@@ -1,8 +1,11 @@
+import subprocess
+import sys
+from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
-from launch_control import cli
+from launch_control import cli, daemon, houston, watch
 
 
 def test_build_parser_configures_expected_arguments(monkeypatch):
@@ -37,6 +40,26 @@ def test_build_parser_configures_expected_arguments(monkeypatch):
         ("-p", "--prompt"),
         ("-l", "--limit"),
         ("-d", "--debug"),
+        ("--progress",),
+        ("--profile",),
+        ("--profile-mode",),
+        ("-w", "--watch"),
+        ("--watch-interval",),
+        ("--debounce",),
+        ("--changed-since",),
+        ("--checkout",),
+        ("-r", "--results"),
+        ("--dead-letter",),
+        ("--key-policy",),
+        ("--key-rate",),
+        ("--connect-timeout",),
+        ("--read-timeout",),
+        ("--deadline",),
+        ("--pipeline-depth",),
+        ("--cassette",),
+        ("--cassette-mode",),
+        ("--latency-scale",),
+        ("--socket",),
     ]
 
     actual_flags = [entry[0] for entry in created_parser.arguments]
@@ -101,17 +124,106 @@ def test_validate_args_rejects_invalid_unit_target():
     assert "Target type must be one of" in str(excinfo.value)
 
 
+def test_validate_args_accepts_mixed_session_and_target_types():
+    args = _base_args(type="unit,integration", target_type="class, function,scenario")
+    cli._validate_args(args)
+    assert args.target_types == ["class", "function", "scenario"]
+    assert args.target_type == "class,function,scenario"
+
+
+def test_validate_args_adds_scenarios_for_mixed_integration_sessions():
+    args = _base_args(type="unit,integration", target_type="module")
+    cli._validate_args(args)
+    assert args.target_types == ["module", "scenario"]
+
+
+def test_validate_args_normalises_session_type():
+    args = _base_args(type=" Unit , INTEGRATION ")
+    cli._validate_args(args)
+    assert args.type == "unit,integration"
+
+
+def test_validate_args_requires_prompt_for_uppercase_prompt_type():
+    args = _base_args(type="PROMPT")
+    with pytest.raises(ValueError) as excinfo:
+        cli._validate_args(args)
+    assert "Prompt is required" in str(excinfo.value)
+
+
+def test_validate_args_rejects_prompt_mixed_with_other_types():
+    args = _base_args(type="prompt,unit", prompt="Investigate")
+    with pytest.raises(ValueError) as excinfo:
+        cli._validate_args(args)
+    assert "cannot be mixed" in str(excinfo.value)
+
+
+def test_validate_args_rejects_watch_with_multiple_target_types():
+    args = _base_args(target_type="class,function", watch=True)
+    with pytest.raises(ValueError) as excinfo:
+        cli._validate_args(args)
+    assert "single target type" in str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    "option, value, flag",
+    [
+        ("changed_since", "main", "--changed-since"),
+        ("profile", "profiles", "--profile"),
+        ("pipeline_depth", 4, "--pipeline-depth"),
+    ],
+)
+def test_validate_args_rejects_options_watch_mode_ignores(option, value, flag):
+    args = _base_args(watch=True, **{option: value})
+    with pytest.raises(ValueError) as excinfo:
+        cli._validate_args(args)
+    assert f"Watch mode does not support {flag}" in str(excinfo.value)
+
+
+def test_validate_args_defaults_pipeline_depth():
+    args = _base_args(pipeline_depth=None)
+    cli._validate_args(args)
+    assert args.pipeline_depth == cli.PIPELINE_DEPTH
+
+
 def test_validate_args_preserves_user_supplied_jira():
     args = _base_args(jira="CUSTOM-1")
     cli._validate_args(args)
     assert args.jira == "CUSTOM-1"
 
 
+def test_validate_args_rejects_watch_for_prompt_type():
+    args = _base_args(type="prompt", prompt="Investigate", watch=True)
+    with pytest.raises(ValueError) as excinfo:
+        cli._validate_args(args)
+    assert "Watch mode" in str(excinfo.value)
+
+
+def test_validate_args_rejects_non_positive_deadline():
+    args = _base_args(deadline=0)
+    with pytest.raises(ValueError) as excinfo:
+        cli._validate_args(args)
+    assert "--deadline" in str(excinfo.value)
+
+
+def test_validate_args_rejects_unknown_profile_mode():
+    args = _base_args(profile="profiles", profile_mode="cprofile,perf")
+    with pytest.raises(ValueError) as excinfo:
+        cli._validate_args(args)
+    assert "Profile mode" in str(excinfo.value)
+
+
+def test_validate_args_rejects_missing_replay_cassette(tmp_path):
+    args = _base_args(cassette=str(tmp_path / "missing.jsonl"))
+    with pytest.raises(ValueError) as excinfo:
+        cli._validate_args(args)
+    assert "does not exist" in str(excinfo.value)
+
+
 def test_main_parses_and_launches(monkeypatch):
     parsed_args = _base_args()
 
     class DummyParser:
-        def parse_args(self):
+        def parse_args(self, argv=None):
             return parsed_args
 
     monkeypatch.setattr(cli, "_build_parser", lambda: DummyParser())
@@ -132,10 +244,154 @@ def test_main_parses_and_launches(monkeypatch):
         def launch(self):
             mission_control_calls["launch_called"] = True
 
-    monkeypatch.setattr(cli, "MissionControl", DummyMissionControl)
+    monkeypatch.setattr(houston, "MissionControl", DummyMissionControl)
 
-    cli.main()
+    cli.main([])
 
     assert validated_args["args"] is parsed_args
     assert mission_control_calls["init_args"] is parsed_args
     assert mission_control_calls["launch_called"] is True
+
+
+def test_main_dispatches_daemon_command(monkeypatch):
+    started = {}
+
+    class DummyDaemon:
+        def __init__(self, socket_path):
+            started["socket"] = socket_path
+
+        def serve_forever(self):
+            started["serving"] = True
+
+    monkeypatch.setattr(daemon, "LaunchDaemon", DummyDaemon)
+
+    cli.main(["daemon", "--socket", "/tmp/test.sock"])
+
+    assert started == {"socket": "/tmp/test.sock", "serving": True}
+
+
+def test_main_submits_to_daemon_when_socket_configured(monkeypatch):
+    parsed_args = _base_args(
+        socket="/tmp/test.sock",
+        results=None,
+        dead_letter=None,
+        checkout=None,
+        profile=None,
+        cassette=None,
+    )
+
+    class DummyParser:
+        def parse_args(self, argv=None):
+            return parsed_args
+
+    monkeypatch.setattr(cli, "_build_parser", lambda: DummyParser())
+    monkeypatch.setattr(cli, "_validate_args", lambda args: None)
+
+    submitted = {}
+
+    def fake_submit(socket_path, args):
+        submitted["socket"] = socket_path
+        submitted["args"] = args
+        return 0
+
+    monkeypatch.setattr(cli.client, "submit", fake_submit)
+
+    def fail_local_launch(args):
+        raise AssertionError("launch should go through the daemon")
+
+    monkeypatch.setattr(houston, "MissionControl", fail_local_launch)
+
+    cli.main([])
+
+    assert submitted == {"socket": "/tmp/test.sock", "args": parsed_args}
+
+
+def test_main_launches_locally_only_when_daemon_unreachable(monkeypatch):
+    parsed_args = _base_args(
+        socket="/tmp/test.sock",
+        results=None,
+        dead_letter=None,
+        checkout=None,
+        profile=None,
+        cassette=None,
+    )
+
+    class DummyParser:
+        def parse_args(self, argv=None):
+            return parsed_args
+
+    monkeypatch.setattr(cli, "_build_parser", lambda: DummyParser())
+    monkeypatch.setattr(cli, "_validate_args", lambda args: None)
+
+    def unreachable(socket_path, args):
+        raise cli.client.DaemonUnavailable("connection refused")
+
+    monkeypatch.setattr(cli.client, "submit", unreachable)
+
+    launched = []
+
+    class DummyMissionControl:
+        def __init__(self, args):
+            pass
+
+        def launch(self):
+            launched.append(True)
+
+    monkeypatch.setattr(houston, "MissionControl", DummyMissionControl)
+
+    cli.main([])
+
+    assert launched == [True]
+
+
+def test_main_watch_ignores_daemon_socket_from_environment(monkeypatch):
+    monkeypatch.setenv("DEVIN_LAUNCH_SOCKET", "/tmp/test.sock")
+    parsed_args = _base_args(socket=None, watch=True, watch_interval=1.0, debounce=2.0)
+
+    class DummyParser:
+        def parse_args(self, argv=None):
+            return parsed_args
+
+    monkeypatch.setattr(cli, "_build_parser", lambda: DummyParser())
+
+    def fail_submit(socket_path, args):
+        raise AssertionError("watch mode should not go through the daemon")
+
+    monkeypatch.setattr(cli.client, "submit", fail_submit)
+    monkeypatch.setattr(
+        houston, "MissionControl", lambda args: SimpleNamespace(args=args)
+    )
+
+    watched = []
+
+    class DummyWatcher:
+        def __init__(self, mc, interval, debounce):
+            watched.append(mc)
+
+        def run(self):
+            pass
+
+    monkeypatch.setattr(watch, "TargetWatcher", DummyWatcher)
+
+    cli.main([])
+
+    assert len(watched) == 1
+    assert parsed_args.socket is None
+
+
+def test_cli_import_skips_launch_machinery():
+    code = (
+        "import sys, launch_control.cli; "
+        "print(sorted(m for m in sys.modules if m.startswith('launch_control.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    loaded = result.stdout.strip()
+    for module in ("houston", "api", "daemon", "discover", "profiling"):
+        assert f"launch_control.{module}'" not in loaded
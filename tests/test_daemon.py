@@ -0,0 +1,256 @@
+import io
+import json
+import os
+import socket
+import stat
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from launch_control import daemon
+from launch_control.api import DevinAPI
+
+
+class DummyAPI:
+    def __init__(self):
+        self.prompts = []
+
+    def post_prompt(self, prompt: str):
+        self.prompts.append(prompt)
+        return SimpleNamespace(status_code=201, text="created")
+
+
+def _prompt_args(**overrides):
+    defaults = {
+        "stack": "asg",
+        "repo": "tii-assisted-grading-services",
+        "type": "prompt",
+        "target_type": None,
+        "prompt": "Investigate outage",
+        "jira": "P2D-123",
+        "limit": 5,
+        "debug": False,
+    }
+    defaults.update(overrides)
+    return SimpleNamespace(**defaults)
+
+
+def test_daemon_runs_jobs_and_streams_output(tmp_path, capsys):
+    socket_path = str(tmp_path / "launch.sock")
+    api = DummyAPI()
+    launch_daemon = daemon.LaunchDaemon(socket_path, api=api)
+    launch_daemon.start()
+    server = launch_daemon._server
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        first = daemon.submit(socket_path, _prompt_args())
+        second = daemon.submit(socket_path, _prompt_args(prompt="Second"))
+    finally:
+        server.shutdown()
+        launch_daemon.stop()
+
+    assert first == 0
+    assert second == 0
+    assert len(api.prompts) == 2
+    assert "Second" in api.prompts[1]
+
+    output = capsys.readouterr().out
+    assert "Launching prompt: inline prompt" in output
+    assert "Response: 201 created" in output
+    assert "Houston, we have liftoff!" in output
+
+
+def test_daemon_reports_job_failures(tmp_path, capsys):
+    socket_path = str(tmp_path / "launch.sock")
+    launch_daemon = daemon.LaunchDaemon(socket_path, api=DummyAPI())
+    launch_daemon.start()
+    server = launch_daemon._server
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        exit_code = daemon.submit(
+            socket_path, _prompt_args(type="unit", target_type="class", stack="zzz")
+        )
+    finally:
+        server.shutdown()
+        launch_daemon.stop()
+
+    assert exit_code == 1
+    assert "Launch failed: Target configuration not found" in capsys.readouterr().out
+
+
+def test_submit_raises_when_daemon_unreachable(tmp_path):
+    with pytest.raises(daemon.DaemonUnavailable):
+        daemon.submit(str(tmp_path / "missing.sock"), _prompt_args())
+
+
+def test_submit_reports_connection_lost_mid_job(tmp_path):
+    socket_path = str(tmp_path / "launch.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+
+    def accept_then_hang_up():
+        conn, _ = server.accept()
+        conn.makefile("rb").readline()
+        conn.sendall(b'{"line": "Launching prompt: inline prompt"}\n')
+        conn.close()
+
+    thread = threading.Thread(target=accept_then_hang_up, daemon=True)
+    thread.start()
+    out = io.StringIO()
+    try:
+        exit_code = daemon.submit(socket_path, _prompt_args(), out=out)
+    finally:
+        thread.join(timeout=1)
+        server.close()
+
+    assert exit_code == 1
+    assert "Launching prompt: inline prompt" in out.getvalue()
+    assert "not relaunched locally" in out.getvalue()
+
+
+class RecordingSession:
+    def __init__(self):
+        self.timeouts = []
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        self.timeouts.append(timeout)
+        return SimpleNamespace(status_code=201, text="created", headers={})
+
+
+def test_daemon_jobs_keep_their_timeout_and_key_options(tmp_path, monkeypatch):
+    monkeypatch.setenv(DevinAPI.API_KEY_ENV_VAR, "key")
+    own = RecordingSession()
+    monkeypatch.setattr(DevinAPI, "default_session", staticmethod(lambda: own))
+
+    shared = RecordingSession()
+    socket_path = str(tmp_path / "launch.sock")
+    launch_daemon = daemon.LaunchDaemon(socket_path, api=DevinAPI(session=shared))
+    launch_daemon.start()
+    server = launch_daemon._server
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        timed = daemon.submit(
+            socket_path,
+            _prompt_args(connect_timeout=1.0, read_timeout=3.0),
+            out=io.StringIO(),
+        )
+        rated = daemon.submit(
+            socket_path,
+            _prompt_args(connect_timeout=1.0, read_timeout=3.0, key_rate=1.0),
+            out=io.StringIO(),
+        )
+    finally:
+        server.shutdown()
+        launch_daemon.stop()
+
+    assert (timed, rated) == (0, 0)
+    # Timeouts ride along with each request on the shared client...
+    assert shared.timeouts == [(1.0, 3.0)]
+    # ...while a per-key rate needs a key pool of the job's own.
+    assert own.timeouts == [(1.0, 3.0)]
+
+
+def test_daemon_jobs_start_with_healthy_keys(tmp_path, monkeypatch):
+    monkeypatch.setenv(DevinAPI.API_KEYS_ENV_VAR, "key-a,key-b")
+    api = DevinAPI(session=RecordingSession())
+    api.key_pool.release(api.key_pool.acquire(), SimpleNamespace(status_code=403))
+    socket_path = str(tmp_path / "launch.sock")
+    launch_daemon = daemon.LaunchDaemon(socket_path, api=api)
+    launch_daemon.start()
+    server = launch_daemon._server
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        exit_code = daemon.submit(socket_path, _prompt_args(), out=io.StringIO())
+    finally:
+        server.shutdown()
+        launch_daemon.stop()
+
+    assert exit_code == 0
+    assert not any(key.revoked for key in api.key_pool.keys)
+
+
+def test_daemon_streams_job_stderr_to_the_client(tmp_path):
+    socket_path = str(tmp_path / "launch.sock")
+    launch_daemon = daemon.LaunchDaemon(socket_path, api=DummyAPI())
+    launch_daemon.start()
+    server = launch_daemon._server
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        exit_code = daemon.submit(
+            socket_path, _prompt_args(results="-"), out=out, err=err
+        )
+    finally:
+        server.shutdown()
+        launch_daemon.stop()
+
+    assert exit_code == 0
+    # The results stream owns stdout; the chatter arrives on stderr.
+    assert json.loads(out.getvalue())["status"] == 201
+    assert "Launching prompt" not in out.getvalue()
+    assert "Launching prompt: inline prompt" in err.getvalue()
+    assert "Launched 1 of 1 prompts" in err.getvalue()
+
+
+def test_daemon_streams_progress_to_the_client(tmp_path):
+    socket_path = str(tmp_path / "launch.sock")
+    launch_daemon = daemon.LaunchDaemon(socket_path, api=DummyAPI())
+    launch_daemon.start()
+    server = launch_daemon._server
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    err = io.StringIO()
+    try:
+        exit_code = daemon.submit(
+            socket_path, _prompt_args(progress=True), out=io.StringIO(), err=err
+        )
+    finally:
+        server.shutdown()
+        launch_daemon.stop()
+
+    assert exit_code == 0
+    assert "Progress: [1/1]" in err.getvalue()
+
+
+def test_daemon_refuses_to_take_over_a_live_socket(tmp_path):
+    socket_path = str(tmp_path / "launch.sock")
+    first = daemon.LaunchDaemon(socket_path, api=DummyAPI())
+    first.start()
+    server = first._server
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with pytest.raises(RuntimeError, match="already listening"):
+            daemon.LaunchDaemon(socket_path, api=DummyAPI()).start()
+        assert daemon.submit(socket_path, _prompt_args(), out=io.StringIO()) == 0
+    finally:
+        server.shutdown()
+        first.stop()
+
+
+def test_daemon_replaces_a_stale_socket_and_restricts_access(tmp_path):
+    socket_path = str(tmp_path / "launch.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    launch_daemon = daemon.LaunchDaemon(socket_path, api=DummyAPI())
+    launch_daemon.start()
+    try:
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+    finally:
+        launch_daemon.stop()
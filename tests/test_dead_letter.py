@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from launch_control.dead_letter import DeadLetterSpool, replay_spool
+
+
+class ReplayAPI:
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.payloads = []
+
+    def post_payload(self, data):
+        self.payloads.append(data)
+        status = self.statuses[data["prompt"]]
+        return SimpleNamespace(status_code=status, text="body")
+
+
+def test_spool_round_trips_failed_launches(tmp_path):
+    spool = DeadLetterSpool(tmp_path)
+    payload = {"prompt": "Launch me", "idempotent": True}
+
+    path = spool.add(
+        payload,
+        SimpleNamespace(status_code=0, text="timed out"),
+        source="prompt_01.txt",
+        target={"target_type": "module", "module": "core"},
+    )
+
+    [(entry_path, entry)] = list(spool.entries())
+    assert entry_path == path
+    assert entry["payload"] == payload
+    assert entry["status"] == 0
+    assert entry["error"] == "timed out"
+    assert entry["target"] == {"target_type": "module", "module": "core"}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_replay_removes_successes_and_keeps_failures(tmp_path):
+    spool = DeadLetterSpool(tmp_path)
+    failure = SimpleNamespace(status_code=503, text="unavailable")
+    spool.add({"prompt": "ok", "idempotent": True}, failure)
+    spool.add({"prompt": "still-bad", "idempotent": True}, failure)
+
+    api = ReplayAPI({"ok": 201, "still-bad": 429})
+
+    succeeded, failed = replay_spool(spool, api, concurrency=2)
+
+    assert (succeeded, failed) == (1, 1)
+    [(_, entry)] = list(spool.entries())
+    assert entry["payload"]["prompt"] == "still-bad"
+    assert entry["status"] == 429
+    assert entry["attempts"] == 2
+
+
+def test_replay_respects_limit(tmp_path):
+    spool = DeadLetterSpool(tmp_path)
+    failure = SimpleNamespace(status_code=0, text="refused")
+    for name in ("a", "b", "c"):
+        spool.add({"prompt": name, "idempotent": True}, failure)
+
+    api = ReplayAPI({"a": 201, "b": 201, "c": 201})
+
+    assert replay_spool(spool, api, limit=2) == (2, 0)
+    assert len(list(spool.entries())) == 1
@@ -0,0 +1,169 @@
+import json
+
+import launch_control.discover as discover_module
+from launch_control.discover import SourceScanner, build_targets, parse_java_source
+
+SERVICE_SOURCE = """
+package com.example.core.service;
+
+import java.util.List;
+
+/**
+ * public void commentedOut() {}
+ */
+public class FooService extends BaseService {
+    private static final String NAME = "public void notAMethod(";
+
+    public FooService(String name) {}
+
+    public List<String> findAll() { return null; }
+
+    public static <T> T convert(Object value) { return null; }
+
+    public void process(String input) {}
+
+    public void process(String input, int retries) {}
+
+    protected void internal() {}
+
+    private static class Helper {}
+}
+"""
+
+
+def _write_module(root, module, relative, source):
+    module_dir = root / module
+    module_dir.mkdir(parents=True, exist_ok=True)
+    (module_dir / "pom.xml").write_text("<project/>", encoding="utf-8")
+    path = module_dir / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+def test_parse_java_source_extracts_public_class_and_methods():
+    classes = parse_java_source(SERVICE_SOURCE, "FooService")
+
+    assert classes == [
+        {
+            "name": "com.example.core.service.FooService",
+            "methods": ["findAll", "convert", "process"],
+        }
+    ]
+
+
+CONTROLLER_SOURCE = """
+package com.example.web;
+
+@RestController
+public class ApiController {
+    @GetMapping("/api/*")
+    public String list() { return "http://example.com/path"; }
+
+    public String show() { return "*/"; }
+
+    public char slash() { return '"'; }
+
+    /** Not a method: public void documented() {} */
+    public void update() {}
+}
+"""
+
+
+def test_parse_java_source_keeps_comment_markers_inside_strings():
+    classes = parse_java_source(CONTROLLER_SOURCE, "ApiController")
+
+    assert classes == [
+        {
+            "name": "com.example.web.ApiController",
+            "methods": ["list", "show", "slash", "update"],
+        }
+    ]
+
+
+def test_parse_java_source_ignores_non_public_types():
+    assert parse_java_source("package a;\nclass Hidden {}\n", "Hidden") == []
+
+
+def test_scanner_maps_files_to_modules_and_skips_tests(tmp_path):
+    repo = tmp_path / "repo"
+    _write_module(
+        repo,
+        "core",
+        "src/main/java/com/example/core/service/FooService.java",
+        SERVICE_SOURCE,
+    )
+    _write_module(
+        repo,
+        "core",
+        "src/test/java/com/example/core/service/FooServiceTest.java",
+        "package com.example;\npublic class FooServiceTest { public void testIt() {} }",
+    )
+
+    files = SourceScanner(repo, workers=4).scan()
+    class_targets, function_targets = build_targets(files)
+
+    assert class_targets == [
+        {"module": "core", "classes": ["com.example.core.service.FooService"]}
+    ]
+    assert function_targets == [
+        {
+            "module": "core",
+            "class": "com.example.core.service.FooService",
+            "functions": ["findAll", "convert", "process"],
+        }
+    ]
+
+
+def test_scanner_reuses_cache_for_unchanged_files(tmp_path):
+    repo = tmp_path / "repo"
+    cache_path = tmp_path / "cache.json"
+    _write_module(repo, "core", "src/main/java/a/FooService.java", SERVICE_SOURCE)
+    changed = _write_module(
+        repo, "api", "src/main/java/a/Api.java", "package a;\npublic class Api {}"
+    )
+
+    first = SourceScanner(repo, cache_path=cache_path)
+    first.scan()
+    assert (first.parsed, first.cached) == (2, 0)
+
+    changed.write_text(
+        "package a;\npublic class Api { public void serve() {} }", encoding="utf-8"
+    )
+    second = SourceScanner(repo, cache_path=cache_path)
+    files = second.scan()
+
+    assert (second.parsed, second.cached) == (1, 1)
+    assert files["api/src/main/java/a/Api.java"]["classes"][0]["methods"] == ["serve"]
+
+
+def test_scanner_discards_cache_from_older_parser(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    cache_path = tmp_path / "cache.json"
+    _write_module(repo, "core", "src/main/java/a/FooService.java", SERVICE_SOURCE)
+    SourceScanner(repo, cache_path=cache_path).scan()
+
+    monkeypatch.setattr(
+        discover_module, "PARSER_VERSION", discover_module.PARSER_VERSION + 1
+    )
+    rescan = SourceScanner(repo, cache_path=cache_path)
+    rescan.scan()
+
+    assert (rescan.parsed, rescan.cached) == (1, 0)
+
+
+def test_discover_writes_target_files(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    repo = tmp_path / "repo"
+    _write_module(repo, "core", "src/main/java/a/FooService.java", SERVICE_SOURCE)
+    monkeypatch.setattr(discover_module, "PROJECT_ROOT", project)
+    monkeypatch.setattr(discover_module, "CACHE_DIR", project / ".cache")
+
+    class_path, function_path = discover_module.discover("asg", checkout=repo)
+
+    assert class_path == project / "targets" / "class" / "asg.json"
+    assert json.loads(class_path.read_text(encoding="utf-8")) == [
+        {"module": "core", "classes": ["com.example.core.service.FooService"]}
+    ]
+    functions = json.loads(function_path.read_text(encoding="utf-8"))
+    assert functions[0]["functions"] == ["findAll", "convert", "process"]
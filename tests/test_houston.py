@@ -1,3 +1,5 @@
+import json
+import sys
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -5,6 +7,7 @@ import pytest
 
 import launch_control.houston as houston
 from launch_control.houston import MissionControl
+from launch_control.rocket_fuel import RocketFuel
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 LAUNCH_PAD_DIR = PROJECT_ROOT / "prompts" / "launch_pad"
@@ -107,6 +110,50 @@ def test_build_prompts_prompt_type():
     assert "!moduleunittest" not in prompt
 
 
+def test_build_prompt_sets_mixes_target_types_under_one_limit():
+    args = _make_args(
+        type="unit,integration",
+        target_type="class,scenario",
+        target_types=["class", "scenario"],
+        limit=3,
+    )
+    mc = MissionControl(args)
+
+    prompts = mc.build_prompt_sets(
+        [
+            ("class", [{"module": "core", "classes": ["a.Foo", "a.Bar"]}]),
+            ("scenario", [{"module": "api", "scenarios": ["54", "55"]}]),
+        ]
+    )
+
+    assert len(prompts) == 3
+    texts = [_read_prompt(prompt) for prompt in prompts]
+    assert "!classunittest" in texts[0]
+    assert "!classunittest" in texts[1]
+    assert "!integrationtest" in texts[2]
+    assert "Scenario\n54" in texts[2]
+
+
+def test_get_target_sets_loads_each_target_type(monkeypatch, tmp_path):
+    args = _make_args(target_type="class,function", target_types=["class", "function"])
+    mc = MissionControl(args)
+
+    payloads = {
+        "class": [{"module": "core", "classes": ["a.Foo"]}],
+        "function": [{"module": "core", "class": "a.Foo", "functions": ["run"]}],
+    }
+    for target_type, payload in payloads.items():
+        (tmp_path / f"{target_type}.json").write_text(
+            json.dumps(payload), encoding="utf-8"
+        )
+    monkeypatch.setattr(
+        mc, "target_path", lambda target_type=None: tmp_path / f"{target_type}.json"
+    )
+
+    assert mc.get_target_sets() == list(payloads.items())
+    assert mc.get_targets() == payloads["class"] + payloads["function"]
+
+
 def test_build_prompts_requires_class_for_function_targets():
     args = _make_args(target_type="function")
     mc = MissionControl(args)
@@ -209,3 +256,210 @@ def test_launch_prompts_skips_missing_files(monkeypatch):
     mc.launch_prompts(prompts)
 
     assert dummy_api.prompts == ["Launch me"]
+
+
+def test_launch_targets_streams_results(monkeypatch, tmp_path):
+    results_path = tmp_path / "results.jsonl"
+    args = _make_args(target_type="class", results=str(results_path))
+
+    class DummyResponse:
+        status_code = 201
+        text = '{"session_id": "devin-1", "url": "https://app.devin.ai/sessions/1"}'
+
+        def json(self):
+            return {"session_id": "devin-1", "url": "https://app.devin.ai/sessions/1"}
+
+    class DummyAPI:
+        def post_prompt(self, prompt: str):
+            return DummyResponse()
+
+    mc = MissionControl(args, api=DummyAPI())
+    mc.launch_targets([{"module": "core", "classes": ["com.example.FooService"]}])
+
+    records = [
+        json.loads(line)
+        for line in results_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert len(records) == 1
+    record = records[0]
+    assert record["status"] == 201
+    assert record["ok"] is True
+    assert record["session_id"] == "devin-1"
+    assert record["url"] == "https://app.devin.ai/sessions/1"
+    assert record["target"] == {
+        "target_type": "class",
+        "module": "core",
+        "class": "com.example.FooService",
+    }
+    assert record["source"].endswith("prompt_01.txt")
+    assert record["latency"] >= 0
+
+
+def test_launch_prompts_spools_failed_launches(monkeypatch, tmp_path):
+    args = _make_args(dead_letter=str(tmp_path))
+
+    LAUNCH_PAD_DIR.mkdir(parents=True, exist_ok=True)
+    prompt_path = LAUNCH_PAD_DIR / "prompt_failed.txt"
+    prompt_path.write_text("Launch me", encoding="utf-8")
+
+    class DummyAPI:
+        def post_prompt(self, prompt: str):
+            return SimpleNamespace(
+                status_code=0,
+                text="connection refused",
+                request_payload={"prompt": prompt, "idempotent": True},
+            )
+
+    mc = MissionControl(args, api=DummyAPI())
+    try:
+        mc.launch_prompts([str(prompt_path)])
+    finally:
+        prompt_path.unlink(missing_ok=True)
+
+    spooled = list(tmp_path.glob("*.json"))
+    assert len(spooled) == 1
+    entry = json.loads(spooled[0].read_text(encoding="utf-8"))
+    assert entry["payload"] == {"prompt": "Launch me", "idempotent": True}
+    assert entry["error"] == "connection refused"
+
+
+def test_launch_prompts_stops_at_deadline(capsys):
+    args = _make_args(type="prompt", target_type=None, deadline=30)
+
+    class DummyAPI:
+        def __init__(self):
+            self.prompts = []
+
+        def post_prompt(self, prompt: str, deadline=None):
+            self.prompts.append(prompt)
+            mc.deadline = 0.0  # the run's time is up after the first launch
+            return SimpleNamespace(status_code=201, text="created")
+
+    mc = MissionControl(args, api=DummyAPI())
+    mc.start_deadline()
+
+    mc.launch_prompts(["first", "second", "third"])
+
+    assert mc.api.prompts == ["first"]
+    output = capsys.readouterr().out
+    assert "Launched 1 of 3 prompts (0 failed)." in output
+    assert "2 prompt(s) not launched" in output
+
+
+def test_launch_pipelined_streams_rendered_prompts(capsys):
+    args = _make_args(target_type="class")
+    targets = [{"module": "core", "classes": ["FooService", "BarService", "Baz"]}]
+
+    class DummyAPI:
+        def __init__(self):
+            self.prompts = []
+
+        def post_prompt(self, prompt: str):
+            self.prompts.append(prompt)
+            return SimpleNamespace(status_code=201, text="created")
+
+    mc = MissionControl(args, api=DummyAPI())
+    mc.launch_pipelined([("class", targets)], depth=1)
+
+    assert len(mc.api.prompts) == 3
+    assert "FooService" in mc.api.prompts[0]
+    assert "Baz" in mc.api.prompts[2]
+    assert mc._manifest[str(LAUNCH_PAD_DIR / "prompt_03.txt")]["class"] == "Baz"
+    assert "Launched 3 of 3 prompts (0 failed)." in capsys.readouterr().out
+
+
+def test_count_prompt_sets_matches_rendered_prompts():
+    args = _make_args(target_type="class", limit=None)
+    target_sets = [
+        ("class", [{"module": "core", "classes": ["Foo", "Bar"]}]),
+        ("scenario", [{"module": "core", "scenarios": [1, 2, 3]}]),
+    ]
+
+    fuel = RocketFuel(args, "repo")
+
+    assert fuel.count_prompt_sets(target_sets) == 5
+    assert len(fuel.build_prompt_sets(target_sets)) == 5
+
+
+def test_launch_prompts_lists_deadline_skipped_sends_as_not_launched(capsys, tmp_path):
+    args = _make_args(
+        type="prompt", target_type=None, deadline=30, dead_letter=str(tmp_path)
+    )
+
+    class DummyAPI:
+        def __init__(self):
+            self.prompts = []
+
+        def post_prompt(self, prompt: str, deadline=None):
+            self.prompts.append(prompt)
+            if len(self.prompts) == 1:
+                return SimpleNamespace(status_code=201, text="created")
+            # Waiting for a benched key ran past the deadline.
+            mc.deadline = 0.0
+            return SimpleNamespace(
+                status_code=0, text="Run deadline reached before sending.", skipped=True
+            )
+
+    mc = MissionControl(args, api=DummyAPI())
+    mc.start_deadline()
+
+    mc.launch_prompts(["first", "second", "third"])
+
+    output = capsys.readouterr().out
+    assert "Launched 1 of 3 prompts (0 failed)." in output
+    assert "2 prompt(s) not launched" in output
+    assert list(tmp_path.glob("*.json")) == []
+
+
+def test_launch_prompts_keeps_tty_progress_on_one_line(monkeypatch, make_tty_stream):
+    stdout, stderr = make_tty_stream(), make_tty_stream()
+    monkeypatch.setattr(sys, "stdout", stdout)
+    monkeypatch.setattr(sys, "stderr", stderr)
+    args = _make_args(type="prompt", target_type=None, progress=True)
+
+    class DummyAPI:
+        def __init__(self):
+            self.prompts = []
+
+        def post_prompt(self, prompt: str):
+            self.prompts.append(prompt)
+            if len(self.prompts) == 2:
+                raise RuntimeError("connection pool exploded")
+            return SimpleNamespace(status_code=201, text="created")
+
+    mc = MissionControl(args, api=DummyAPI())
+    with pytest.raises(RuntimeError):
+        mc.launch_prompts(["first", "second"])
+
+    assert "Launching prompt" not in stdout.getvalue()
+    assert "Response:" not in stdout.getvalue()
+    # The status line is finished off even though the launch loop raised.
+    assert stderr.getvalue().endswith("\n")
+
+
+def test_launch_pipelined_stops_rendering_at_deadline(capsys):
+    args = _make_args(target_type="class", limit=None, deadline=30)
+    classes = [f"Service{index}" for index in range(200)]
+
+    class DummyAPI:
+        def __init__(self):
+            self.prompts = []
+
+        def post_prompt(self, prompt: str, deadline=None):
+            self.prompts.append(prompt)
+            mc.deadline = 0.0  # the run's time is up after the first launch
+            return SimpleNamespace(status_code=201, text="created")
+
+    mc = MissionControl(args, api=DummyAPI())
+    mc.start_deadline()
+    mc.launch_pipelined([("class", [{"module": "core", "classes": classes}])], depth=2)
+
+    assert len(mc.api.prompts) == 1
+    written = list(LAUNCH_PAD_DIR.glob("prompt_*.txt"))
+    # One launched, one in hand at the deadline, the queue and the one blocked
+    # on it: rendering stopped long before the 200th prompt.
+    assert len(written) <= 6
+    output = capsys.readouterr().out
+    assert "Launched 1 of 200 prompts (0 failed)." in output
+    assert "Deadline reached, 199 prompt(s) not launched:" in output
+    assert "more that were never rendered." in output
@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+
+import pytest
+
+from launch_control.api import DevinAPI
+from launch_control.key_pool import KeyPool, load_keys
+
+
+def _response(status, headers=None):
+    return SimpleNamespace(status_code=status, text="", headers=headers or {})
+
+
+def test_round_robin_rotates_keys():
+    pool = KeyPool(["key-a", "key-b", "key-c"])
+
+    chosen = []
+    for _ in range(4):
+        key = pool.acquire()
+        chosen.append(key.key)
+        pool.release(key, _response(201))
+
+    assert chosen == ["key-a", "key-b", "key-c", "key-a"]
+
+
+def test_least_loaded_prefers_idle_keys():
+    pool = KeyPool(["key-a", "key-b"], policy="least-loaded")
+
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert {first.key, second.key} == {"key-a", "key-b"}
+
+
+def test_revoked_keys_are_benched_for_the_run():
+    pool = KeyPool(["key-a", "key-b"])
+
+    key = pool.acquire()
+    pool.release(key, _response(401))
+
+    assert [pool.acquire().key for _ in range(3)] == ["key-b"] * 3
+
+
+def test_last_usable_key_is_not_revoked():
+    pool = KeyPool(["key-a", "key-b"])
+    pool.release(pool.acquire(), _response(403))
+    pool.release(pool.acquire(), _response(403))
+
+    assert [key.revoked for key in pool.keys] == [True, False]
+    assert pool.acquire().key == "key-b"
+
+
+def test_reset_clears_benches_and_revocations(clock):
+    pool = KeyPool(["key-a", "key-b"], clock=clock, sleep=clock.sleep)
+    pool.release(pool.acquire(), _response(401))
+    pool.release(pool.acquire(), _response(429, {"Retry-After": "30"}))
+
+    pool.reset()
+
+    assert pool.acquire().key == "key-a"
+    assert clock.now == 0.0
+
+
+def test_throttled_key_waits_for_retry_after(clock):
+    pool = KeyPool(["key-a"], clock=clock, sleep=clock.sleep)
+
+    pool.release(pool.acquire(), _response(429, {"Retry-After": "30"}))
+    key = pool.acquire()
+
+    assert key.key == "key-a"
+    assert clock.now == 30.0
+
+
+def test_throttled_key_wait_stops_at_deadline(clock):
+    pool = KeyPool(["key-a"], clock=clock, sleep=clock.sleep)
+
+    pool.release(pool.acquire(), _response(429, {"Retry-After": "3600"}))
+
+    assert pool.acquire(deadline=5.0) is None
+    assert clock.now == 5.0
+
+
+def test_load_keys_reads_env_list_and_key_file(monkeypatch, tmp_path):
+    monkeypatch.setenv("TEST_KEYS", "key-a, key-b,,")
+    assert load_keys("TEST_KEYS", "TEST_KEY_FILE") == ["key-a", "key-b"]
+
+    key_file = tmp_path / "keys.txt"
+    key_file.write_text("# nightly accounts\nkey-c\n\nkey-d\n", encoding="utf-8")
+    monkeypatch.delenv("TEST_KEYS")
+    monkeypatch.setenv("TEST_KEY_FILE", str(key_file))
+    assert load_keys("TEST_KEYS", "TEST_KEY_FILE") == ["key-c", "key-d"]
+
+
+def test_devin_api_spreads_posts_across_pool(monkeypatch):
+    monkeypatch.setenv("DEVIN_API_KEYS", "key-a,key-b")
+
+    class DummySession:
+        def __init__(self):
+            self.keys = []
+
+        def post(self, url, headers, data, **kwargs):
+            self.keys.append(headers["Authorization"])
+            return SimpleNamespace(status_code=201, text="created")
+
+    session = DummySession()
+    api = DevinAPI(session=session)
+    api.post_prompt("one")
+    api.post_prompt("two")
+
+    assert session.keys == ["Bearer key-a", "Bearer key-b"]
+
+
+def test_key_pool_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        KeyPool(["key-a"], policy="random")
@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+
+from launch_control.pipeline import RenderAhead
+
+
+def test_render_ahead_yields_items_in_order():
+    with RenderAhead(iter(range(20)), depth=3) as rendered:
+        assert list(rendered) == list(range(20))
+
+
+def test_render_ahead_applies_backpressure():
+    produced = []
+
+    def items():
+        for index in range(10):
+            produced.append(index)
+            yield index
+
+    with RenderAhead(items(), depth=2) as rendered:
+        stream = iter(rendered)
+        assert next(stream) == 0
+        threading.Event().wait(0.2)
+        # One item handed over, two queued and one blocked on the full queue.
+        assert len(produced) <= 4
+
+
+def test_render_ahead_reraises_producer_errors():
+    def items():
+        yield "first"
+        raise ValueError("No prompts were generated.")
+
+    with RenderAhead(items(), depth=2) as rendered:
+        stream = iter(rendered)
+        assert next(stream) == "first"
+        with pytest.raises(ValueError, match="No prompts"):
+            next(stream)
+
+
+def test_render_ahead_close_stops_producer():
+    produced = []
+
+    def items():
+        index = 0
+        while True:
+            produced.append(index)
+            yield index
+            index += 1
+
+    pipeline = RenderAhead(items(), depth=1).start()
+    next(iter(pipeline))
+    pipeline.close()
+
+    count = len(produced)
+    threading.Event().wait(0.2)
+    assert len(produced) == count
+
+
+def test_render_ahead_cancel_returns_queued_items_and_stops():
+    produced = []
+
+    def items():
+        for index in range(100):
+            produced.append(index)
+            yield index
+
+    pipeline = RenderAhead(items(), depth=3).start()
+    stream = iter(pipeline)
+    assert next(stream) == 0
+    threading.Event().wait(0.2)
+
+    pending = pipeline.cancel()
+
+    assert pending == list(range(1, 1 + len(pending)))
+    assert 1 <= len(pending) <= 3
+    count = len(produced)
+    threading.Event().wait(0.2)
+    assert len(produced) == count < 100
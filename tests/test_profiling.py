@@ -0,0 +1,52 @@
+import json
+import threading
+import time
+
+from launch_control.profiling import StageProfiler
+
+
+def _busy():
+    return [str(index) * 10 for index in range(20000)]
+
+
+def test_stage_profiler_writes_per_stage_reports(tmp_path):
+    profiler = StageProfiler(tmp_path, modes=("cprofile", "tracemalloc", "sample"))
+
+    with profiler.stage("render"):
+        data = _busy()
+        time.sleep(0.02)
+    profiler.close()
+
+    run_dir = profiler.run_dir
+    assert data
+    assert (run_dir / "render.prof").exists()
+    assert "_busy" in (run_dir / "render.txt").read_text(encoding="utf-8")
+    assert "allocation sites" in (run_dir / "render.alloc.txt").read_text(
+        encoding="utf-8"
+    )
+    assert (run_dir / "render.samples.txt").exists()
+
+    summary = json.loads((run_dir / "summary.json").read_text(encoding="utf-8"))
+    assert summary["stages"]["render"] > 0
+    assert summary["modes"] == ["cprofile", "tracemalloc", "sample"]
+
+
+def _render_on_worker():
+    return [str(index) * 10 for index in range(20000)]
+
+
+def test_stage_profiler_merges_worker_threads(tmp_path):
+    profiler = StageProfiler(tmp_path, modes=("cprofile",))
+
+    def work():
+        with profiler.worker("pipeline"):
+            _render_on_worker()
+
+    with profiler.stage("pipeline"):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+    profiler.close()
+
+    report = (profiler.run_dir / "pipeline.txt").read_text(encoding="utf-8")
+    assert "_render_on_worker" in report
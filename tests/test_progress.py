@@ -0,0 +1,72 @@
+import io
+
+from launch_control.progress import ProgressReporter
+
+
+def test_summary_reports_rate_errors_and_eta(clock):
+    reporter = ProgressReporter(stream=io.StringIO(), clock=clock)
+    reporter.start(10)
+
+    for ok in (True, True, False, True):
+        reporter.begin()
+        reporter.finish(ok)
+    reporter.begin()
+    clock.now = 2.0
+
+    summary = reporter.summary()
+
+    assert summary.startswith("[ 4/10]  40.0%")
+    assert "2.00/s" in summary
+    assert "in-flight 1" in summary
+    assert "errors 1 (25.0%)" in summary
+    assert "ETA 3s" in summary
+
+
+def test_non_tty_output_is_periodic_log_lines(clock):
+    stream = io.StringIO()
+    reporter = ProgressReporter(stream=stream, log_interval=10.0, clock=clock)
+    reporter.start(3)
+
+    reporter.begin()
+    reporter.finish(True)
+    assert stream.getvalue() == ""
+
+    clock.now = 11.0
+    reporter.begin()
+    reporter.finish(True)
+    reporter.close()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert all(line.startswith("Progress: ") for line in lines)
+    assert lines[-1].startswith("Progress: [2/3]")
+
+
+def test_tty_output_redraws_a_single_line(clock, make_tty_stream):
+    stream = make_tty_stream()
+    reporter = ProgressReporter(stream=stream, clock=clock)
+    reporter.start(2)
+
+    clock.now = 1.0
+    reporter.begin()
+    reporter.finish(True)
+    reporter.skip()
+    reporter.close()
+
+    output = stream.getvalue()
+    assert output.count("\r") == 2
+    assert output.endswith("\n")
+    assert "[1/1] 100.0%" in output
+
+
+def test_note_clears_and_redraws_the_status_line(clock, make_tty_stream):
+    stream = make_tty_stream()
+    out = io.StringIO()
+    reporter = ProgressReporter(stream=stream, clock=clock)
+    reporter.start(2)
+
+    reporter.note("Launch failed, spooled to x.json", stream=out)
+
+    assert out.getvalue() == "Launch failed, spooled to x.json\n"
+    assert stream.getvalue().startswith("\r\033[K")
+    assert stream.getvalue().endswith(reporter.summary())
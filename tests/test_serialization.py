@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+import launch_control.serialization as serialization
+
+PAYLOAD = {"prompt": "Launch me", "idempotent": True, "tags": ["a", "b"]}
+
+
+@pytest.fixture(params=["accelerated", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    return serialization.backend()
+
+
+def test_dumps_bytes_round_trips_through_stdlib(backend):
+    body = serialization.dumps_bytes(PAYLOAD)
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == PAYLOAD
+
+
+def test_loads_accepts_text_and_bytes(backend):
+    text = json.dumps(PAYLOAD)
+
+    assert serialization.loads(text) == PAYLOAD
+    assert serialization.loads(text.encode("utf-8")) == PAYLOAD
+
+
+def test_loads_raises_value_error_on_bad_input(backend):
+    with pytest.raises(ValueError):
+        serialization.loads(b"{not json")
+
+
+def test_dumps_indents_like_stdlib(backend):
+    assert serialization.dumps(PAYLOAD, indent=2) == json.dumps(PAYLOAD, indent=2)
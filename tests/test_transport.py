@@ -0,0 +1,26 @@
+from launch_control.transport import RateLimiter, dispatch
+
+
+def test_rate_limiter_spaces_calls(clock):
+    # Three callers arriving at once: the clock does not move while they wait.
+    limiter = RateLimiter(rate=4, clock=clock, sleep=clock.sleeps.append)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    assert clock.sleeps == [0.25, 0.5]
+
+
+def test_rate_limiter_disabled_without_rate(clock):
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+
+    limiter.acquire()
+    limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_dispatch_yields_every_item_with_its_result():
+    results = dict(dispatch(range(20), lambda item: item * 2, concurrency=3))
+
+    assert results == {item: item * 2 for item in range(20)}
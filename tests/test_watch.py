@@ -0,0 +1,103 @@
+import json
+from types import SimpleNamespace
+
+from launch_control.targets import assemble_targets, explode_targets
+from launch_control.watch import TargetWatcher
+
+
+class DummyMissionControl:
+    def __init__(self, path, target_type="class", limit=5):
+        self.args = SimpleNamespace(target_type=target_type, limit=limit)
+        self._path = path
+        self.launched = []
+
+    def target_path(self):
+        return self._path
+
+    def launch_targets(self, targets):
+        self.launched.append(targets)
+
+
+def _write(path, targets):
+    path.write_text(json.dumps(targets), encoding="utf-8")
+
+
+def test_explode_and_assemble_round_trip_function_targets():
+    targets = [
+        {"module": "core", "class": "com.example.Foo", "functions": ["a", "b"]},
+        {"module": "core", "class": "com.example.Bar", "functions": ["c"]},
+    ]
+
+    keys = explode_targets(targets, "function")
+
+    assert keys == [
+        ("core", "com.example.Foo", "a"),
+        ("core", "com.example.Foo", "b"),
+        ("core", "com.example.Bar", "c"),
+    ]
+    assert assemble_targets(keys, "function") == targets
+
+
+def test_watcher_launches_only_added_entries_after_debounce(tmp_path, clock):
+    path = tmp_path / "asg.json"
+    _write(path, [{"module": "core", "classes": ["com.example.Foo"]}])
+
+    mc = DummyMissionControl(path)
+    watcher = TargetWatcher(mc, debounce=2.0, clock=clock)
+    watcher.prime()
+
+    _write(
+        path,
+        [{"module": "core", "classes": ["com.example.Foo", "com.example.Bar"]}],
+    )
+
+    assert watcher.poll() == 0
+    clock.now = 1.0
+    assert watcher.poll() == 0
+    clock.now = 2.5
+    assert watcher.poll() == 1
+
+    assert mc.launched == [[{"module": "core", "classes": ["com.example.Bar"]}]]
+    assert watcher.poll() == 0
+
+
+def test_watcher_restarts_debounce_on_rapid_rewrites(tmp_path, clock):
+    path = tmp_path / "asg.json"
+    mc = DummyMissionControl(path)
+    watcher = TargetWatcher(mc, debounce=2.0, clock=clock)
+    watcher.prime()
+
+    _write(path, [{"module": "core", "classes": ["com.example.Foo"]}])
+    watcher.poll()
+
+    clock.now = 1.5
+    _write(
+        path,
+        [{"module": "core", "classes": ["com.example.Foo", "com.example.BarBaz"]}],
+    )
+    assert watcher.poll() == 0
+
+    clock.now = 3.0
+    assert watcher.poll() == 0
+    assert mc.launched == []
+
+    clock.now = 4.0
+    assert watcher.poll() == 2
+
+
+def test_watcher_carries_entries_over_the_limit_to_later_polls(tmp_path, clock):
+    path = tmp_path / "asg.json"
+    mc = DummyMissionControl(path, limit=1)
+    watcher = TargetWatcher(mc, debounce=0.0, clock=clock)
+    watcher.prime()
+
+    _write(path, [{"module": "core", "classes": ["com.example.A", "com.example.B"]}])
+    watcher.poll()
+
+    assert watcher.poll() == 1
+    assert watcher.poll() == 1
+    assert watcher.poll() == 0
+    assert [batch[0]["classes"] for batch in mc.launched] == [
+        ["com.example.A"],
+        ["com.example.B"],
+    ]